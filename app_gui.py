@@ -1,5 +1,6 @@
 import glob
 import json
+import multiprocessing
 import os
 import queue
 import subprocess
@@ -40,6 +41,8 @@ class App:
         self.creds_var = tk.StringVar()
         self.creds_prev = ""
         self.service_email = ""
+        # Worker processes for PDF extraction; only set through ui_settings.json ("workers").
+        self.max_workers = None
 
         self._load_settings()
         # Status variables
@@ -154,6 +157,8 @@ class App:
             self.mode_var.set(data.get("mode", "service"))
             self.creds_var.set(data.get("creds", ""))
             self.creds_prev = data.get("creds_prev", "")
+            workers = data.get("workers")
+            self.max_workers = workers if isinstance(workers, int) and workers > 0 else None
             self.service_email = self._read_service_email(self.creds_var.get().strip())
         except FileNotFoundError:
             pass
@@ -171,6 +176,7 @@ class App:
             "mode": self.mode_var.get(),
             "creds": self.creds_var.get().strip(),
             "creds_prev": self.creds_prev,
+            "workers": self.max_workers,
         }
         try:
             with open(self.settings_path, "w", encoding="utf-8") as f:
@@ -315,6 +321,7 @@ class App:
             sheet_cfg=sheet_cfg,
             settings=settings,
             message_queue=self.message_queue,
+            max_workers=self.max_workers,
         )
         self.worker.start()
         self.start_btn.configure(state="disabled")
@@ -356,6 +363,9 @@ class App:
         mtype = msg.get("type")
         if mtype == "log":
             self._append_log(msg.get("message", ""))
+        elif mtype == "log_batch":
+            # One Text insert for the whole batch.
+            self._append_log("\n".join(msg.get("messages", [])))
         elif mtype == "progress":
             stats = msg.get("stats", {})
             total = stats.get("total", 0) or 0
@@ -401,4 +411,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -20,9 +20,8 @@ from clean import (
 )
 from extractor_form_a import extract_form_a
 from extractor_form_admin import extract_form_admin
-from extractor_form_b import extract_form_b
+from extractor_form_bd import extract_form_b, extract_form_d
 from extractor_form_c import extract_form_c
-from extractor_form_d import extract_form_d
 from form_detector import DetectionResult, FormType, detect_form
 
 FORM_EXTRACTORS = {
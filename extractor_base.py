@@ -1,6 +1,7 @@
 import re
 from collections import defaultdict
-from typing import Dict, List, Sequence
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 Columns = [
     "Deceased Property Address",
@@ -122,7 +123,7 @@ BANNED_ADDRESS_TERMS = [
 ]
 
 # Role terms that are not valid relationships
-ROLE_BLACKLIST = [
+ROLE_BLACKLIST = frozenset({
     "executor",
     "executrix",
     "administrator",
@@ -134,7 +135,7 @@ ROLE_BLACKLIST = [
     "fiduciary",
     "beneficiary",
     "legatee",
-]
+})
 
 # Allowed relationship values for normalization/validation
 REL_ALLOWED = [
@@ -240,14 +241,24 @@ ADDRESS_STREET_TOKENS = {
 
 
 def normalize_text(text: str) -> str:
+    # Text is often normalized already (parse_fields hands it on to detection and the extractors);
+    # without any of these the substitutions below are no-ops.
+    if "\r" not in text and "\t" not in text and "  " not in text and "\n\n" not in text:
+        return text.strip()
     cleaned = text.replace("\r", "\n")
     cleaned = re.sub(r"[ \t]+", " ", cleaned)
     cleaned = re.sub(r"\n{2,}", "\n", cleaned)
     return cleaned.strip()
 
 
+@lru_cache(maxsize=8)
+def _split_lines(text: str) -> Tuple[str, ...]:
+    return tuple(ln.strip() for ln in normalize_text(text).splitlines())
+
+
 def split_lines(text: str) -> List[str]:
-    return [ln.strip() for ln in normalize_text(text).splitlines()]
+    # Normalizing and splitting the whole document is shared by every caller on the same text
+    return list(_split_lines(text))
 
 
 def strip_aka(name: str) -> str:
@@ -549,39 +560,68 @@ def clean_address(addr: str) -> str:
     return addr
 
 
+# Address helpers run for every candidate window, so their patterns are compiled once here.
+_STATE_NAMES = r"NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois"
+_DIGIT_RE = re.compile(r"\d")
+_PO_BOX_RE = re.compile(r"\bpo\s*box\b")
+_STATE_WORD_RE = re.compile(rf"\b({_STATE_NAMES})\b", re.IGNORECASE)
+_ZIP_RE = re.compile(r"\d{5}(?:-\d{4})?")
+_WHITESPACE_RE = re.compile(r"\s+")
+_LEADING_S_DIGIT_RE = re.compile(r"^S(\d)")
+_DIGIT_LETTER_RE = re.compile(r"(\d)([A-Za-z])")
+_LETTER_DIGIT_RE = re.compile(r"([A-Za-z])(\d)")
+_FUSED_SUFFIX_RE = re.compile(
+    r"(?i)([A-Za-z]+)(avenue|ave|street|st|road|rd|drive|dr|lane|ln|court|ct|place|pl|boulevard|blvd)"
+)
+_STREET_THEN_REST_RE = re.compile(
+    r"^(\d[^,]+?(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Court|Ct|Place|Pl|Way|Pkwy|Parkway))\s+(.*)$",
+    re.IGNORECASE,
+)
+_LEADING_NUMBER_COMMA_RE = re.compile(r"^(\d+),\s*")
+_MISSING_CITY_COMMA_RE = re.compile(r"^(\d[^,]+?)\s+([A-Za-z .'-]+),\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)")
+_CITY_STATE_ZIP_RE = re.compile(rf"([A-Za-z .'-]+),\s*({_STATE_NAMES})\s+(\d{{5}}(?:-\d{{4}})?)", re.IGNORECASE)
+_BANNED_TERMS_RE = re.compile("|".join(re.escape(t) for t in BANNED_ADDRESS_TERMS), re.IGNORECASE)
+_PARENS_RE = re.compile(r"\([^)]+\)")
+_FIND_ADDRESS_RES = tuple(
+    re.compile(pat, re.MULTILINE)
+    for pat in (
+        r"\d{1,6}[^\n,]{0,60}?,\s*[A-Za-z .'-]+,\s*[A-Z]{2}\s*\d{5}(?:-\d{4})?",
+        r"\d{1,6}\s+[A-Za-z0-9 .'-]+?\s+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Place|Pl|Boulevard|Blvd|Terrace|Ter|Court|Ct|Way)[A-Za-z0-9 .'-]*?,?\s+[A-Za-z .'-]+,?\s+"
+        rf"(?:{_STATE_NAMES})\s+\d{{5}}(?:-\d{{4}})?",
+        rf"\d{{1,6}}\s+[A-Za-z0-9 .'-]+?,\s*[A-Za-z .'-]+(?:\s+[A-Za-z .'-]+)?\s+(?:{_STATE_NAMES})\s+\d{{5}}(?:-\d{{4}})?",
+    )
+)
+_PHONE_RE = re.compile(r"(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})")
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+
+
 def _address_has_required_components(addr: str) -> bool:
     if not addr:
         return False
     low = addr.lower()
-    if not (re.match(r"\d", addr) or re.search(r"\bpo\s*box\b", low)):
+    if not (_DIGIT_RE.match(addr) or _PO_BOX_RE.search(low)):
         return False
     if not any(tok in low for tok in ADDRESS_STREET_TOKENS):
         return False
-    if not re.search(
-        r"\b(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\b",
-        addr,
-        re.IGNORECASE,
-    ):
+    if not _STATE_WORD_RE.search(addr):
         return False
-    if re.search(r"\d{5}(?:-\d{4})?", addr):
+    if _ZIP_RE.search(addr):
         return True
     return False
 
 
-def clean_address_strict(raw: str, field: str = "", debug=None) -> str:
-    if not raw:
-        return ""
+@lru_cache(maxsize=1024)
+def _clean_address_strict(raw: str, field: str) -> Tuple[str, Tuple[str, ...]]:
+    # Pure part of clean_address_strict: returns (address, warnings) so fallback paths
+    # re-cleaning the same (raw, field) reuse the parse and still replay debug warnings.
+    warnings: List[str] = []
     addr = raw.replace("\n", " ")
-    addr = re.sub(r"\s+", " ", addr).strip(" ,")
+    addr = _WHITESPACE_RE.sub(" ", addr).strip(" ,")
     # OCR fixes: leading S -> 5 before a digit, fuse-break between digits and letters, fused street suffixes
-    addr = re.sub(r"^S(\d)", r"5\1", addr)
-    addr = re.sub(r"(\d)([A-Za-z])", r"\1 \2", addr)
-    addr = re.sub(r"([A-Za-z])(\d)", r"\1 \2", addr)
-    addr = re.sub(
-        r"(?i)([A-Za-z]+)(avenue|ave|street|st|road|rd|drive|dr|lane|ln|court|ct|place|pl|boulevard|blvd)",
-        r"\1 \2",
-        addr,
-    )
+    addr = _LEADING_S_DIGIT_RE.sub(r"5\1", addr)
+    addr = _DIGIT_LETTER_RE.sub(r"\1 \2", addr)
+    addr = _LETTER_DIGIT_RE.sub(r"\1 \2", addr)
+    addr = _FUSED_SUFFIX_RE.sub(r"\1 \2", addr)
     ocr_fixes = {
         "ROMAN AVENUE": "Roman Avenue",
     }
@@ -592,43 +632,26 @@ def clean_address_strict(raw: str, field: str = "", debug=None) -> str:
         if term in low:
             split_idx = low.find(term)
             addr = addr[:split_idx].strip(" ,")
-            if debug is not None:
-                debug.setdefault("_warnings", []).append(
-                    f"WARNING: Address contamination detected (role/fiduciary text). Field={field} Value={raw}"
-                )
+            warnings.append(f"WARNING: Address contamination detected (role/fiduciary text). Field={field} Value={raw}")
             break
     addr = clean_address(addr)
     street_comma_match = None
     if "," not in addr:
-        street_comma_match = re.match(
-            r"^(\d[^,]+?(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Court|Ct|Place|Pl|Way|Pkwy|Parkway))\s+(.*)$",
-            addr,
-            re.IGNORECASE,
-        )
+        street_comma_match = _STREET_THEN_REST_RE.match(addr)
         if street_comma_match and "," not in street_comma_match.group(1):
             addr = f"{street_comma_match.group(1)}, {street_comma_match.group(2)}"
-    addr = re.sub(r"^(\d+),\s*", r"\1 ", addr)
+    addr = _LEADING_NUMBER_COMMA_RE.sub(r"\1 ", addr)
     # Ensure street-city comma when missing before state/zip
-    addr = re.sub(
-        r"^(\d[^,]+?)\s+([A-Za-z .'-]+),\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)",
-        r"\1, \2, \3 \4",
-        addr,
-    )
+    addr = _MISSING_CITY_COMMA_RE.sub(r"\1, \2, \3 \4", addr)
     if not _address_has_required_components(addr) or len(addr) < 8:
         # try to append city/state/zip from raw if street exists
         street_part = addr
-        if street_part and re.match(r"\d", street_part):
-            matches = list(
-                re.finditer(
-                    r"([A-Za-z .'-]+),\s*(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5}(?:-\d{4})?)",
-                    raw,
-                    re.IGNORECASE,
-                )
-            )
+        if street_part and _DIGIT_RE.match(street_part):
+            matches = list(_CITY_STATE_ZIP_RE.finditer(raw))
             for m_city in reversed(matches):
                 city_candidate = m_city.group(1).strip()
                 # strip blacklist terms inside city candidate
-                city_candidate = re.split("|".join([re.escape(t) for t in BANNED_ADDRESS_TERMS]), city_candidate, flags=re.IGNORECASE)[0].strip(" ,")
+                city_candidate = _BANNED_TERMS_RE.split(city_candidate)[0].strip(" ,")
                 if not city_candidate:
                     parts = [p for p in m_city.group(1).split() if p and p.isalpha()]
                     if parts:
@@ -638,7 +661,7 @@ def clean_address_strict(raw: str, field: str = "", debug=None) -> str:
                 candidate = f"{street_part}, {city_candidate}, {m_city.group(2)} {m_city.group(3)}"
                 candidate = clean_address(candidate)
                 if _address_has_required_components(candidate):
-                    return candidate
+                    return candidate, tuple(warnings)
         # try to salvage another address substring from the raw text
         for candidate in find_addresses(raw):
             candidate_low = candidate.lower()
@@ -649,7 +672,7 @@ def clean_address_strict(raw: str, field: str = "", debug=None) -> str:
                     candidate_low = candidate.lower()
             cand_clean = clean_address(candidate)
             if _address_has_required_components(cand_clean) and len(cand_clean) >= 8:
-                return cand_clean
+                return cand_clean, tuple(warnings)
         # try again after stripping blacklist segments from raw
         cleaned_raw = raw
         for term in BANNED_ADDRESS_TERMS:
@@ -657,42 +680,44 @@ def clean_address_strict(raw: str, field: str = "", debug=None) -> str:
         for candidate in find_addresses(cleaned_raw):
             cand_clean = clean_address(candidate)
             if _address_has_required_components(cand_clean) and len(cand_clean) >= 8:
-                return cand_clean
-        if debug is not None:
-            debug.setdefault("_warnings", []).append(
-                f"WARNING: Address rejected (fails validation). Field={field} Value={raw}"
-            )
+                return cand_clean, tuple(warnings)
+        warnings.append(f"WARNING: Address rejected (fails validation). Field={field} Value={raw}")
         # if it still looks like an address with a street number, return a lenient cleaned version
-        if re.search(r"\d", addr):
-            return clean_address(addr)
+        if _DIGIT_RE.search(addr):
+            return clean_address(addr), tuple(warnings)
+        return "", tuple(warnings)
+    addr = _LEADING_NUMBER_COMMA_RE.sub(r"\1 ", addr)
+    return addr, tuple(warnings)
+
+
+def clean_address_strict(raw: str, field: str = "", debug=None) -> str:
+    if not raw:
         return ""
-    addr = re.sub(r"^(\d+),\s*", r"\1 ", addr)
+    addr, warnings = _clean_address_strict(raw, field)
+    if warnings and debug is not None:
+        debug.setdefault("_warnings", []).extend(warnings)
     return addr
 
 
 def find_addresses(text: str) -> List[str]:
-    search_text = re.sub(r"\([^)]+\)", " ", text)
-    state_pattern = r"(?:NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)"
-    patterns = [
-        r"\d{1,6}[^\n,]{0,60}?,\s*[A-Za-z .'-]+,\s*[A-Z]{2}\s*\d{5}(?:-\d{4})?",
-        r"\d{1,6}\s+[A-Za-z0-9 .'-]+?\s+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Place|Pl|Boulevard|Blvd|Terrace|Ter|Court|Ct|Way)[A-Za-z0-9 .'-]*?,?\s+[A-Za-z .'-]+,?\s+"
-        + state_pattern
-        + r"\s+\d{5}(?:-\d{4})?",
-        r"\d{1,6}\s+[A-Za-z0-9 .'-]+?,\s*[A-Za-z .'-]+(?:\s+[A-Za-z .'-]+)?\s+"
-        + state_pattern
-        + r"\s+\d{5}(?:-\d{4})?",
-    ]
+    search_text = _PARENS_RE.sub(" ", text)
     results: List[str] = []
-    for pat in patterns:
-        for m in re.finditer(pat, search_text, re.MULTILINE):
+    for pattern in _FIND_ADDRESS_RES:
+        for m in pattern.finditer(search_text):
             cleaned = clean_address(m.group(0))
             if cleaned not in results:
                 results.append(cleaned)
     return results
 
 
+@lru_cache(maxsize=8)
+def lowered_text(text: str) -> str:
+    # Detection and the extractors probe the same document text for several keyword sets; lowercase it once.
+    return text.lower()
+
+
 def find_address_near_keywords(text: str, keywords: Sequence[str]) -> str:
-    lowered = text.lower()
+    lowered = lowered_text(text)
     for kw in keywords:
         start = lowered.find(kw.lower())
         if start != -1:
@@ -706,7 +731,7 @@ def find_address_near_keywords(text: str, keywords: Sequence[str]) -> str:
     return ""
 
 
-def pick_best_address(candidates: Sequence[str]) -> str:
+def pick_best_address(candidates: Iterable[str]) -> str:
     seen = set()
     best_addr = ""
     best_score = -10**9
@@ -722,34 +747,49 @@ def pick_best_address(candidates: Sequence[str]) -> str:
 
 
 def extract_phone(text: str) -> str:
-    phone_re = re.compile(r"(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})")
-    match = phone_re.search(text)
+    match = _PHONE_RE.search(text)
     if match:
         return match.group(1)
     return ""
 
 
 def extract_email(text: str) -> str:
-    email_re = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
-    match = email_re.search(text)
+    match = _EMAIL_RE.search(text)
     if match:
         return match.group(0)
     return ""
 
 
-def window_after_labels(lines: Sequence[str], label_patterns: Sequence[str], max_lines: int = 4, include_current: bool = False) -> List[str]:
-    matches: List[str] = []
+def _label_regexes(label_patterns: Sequence) -> List["re.Pattern[str]"]:
+    # Accept precompiled patterns as-is; compile plain strings case-insensitively.
+    return [pat if isinstance(pat, re.Pattern) else re.compile(pat, re.IGNORECASE) for pat in label_patterns]
+
+
+def window_after_labels_multi(
+    lines: Sequence[str], label_sets: Dict[str, Sequence], max_lines: int = 4, include_current: bool = False
+) -> List[Tuple[str, str]]:
+    """
+    Single pass over lines for several label groups; yields (kind, snippet) pairs.
+    Per kind, snippets come out in the same order window_after_labels would give them.
+    """
+    groups = [(kind, _label_regexes(patterns)) for kind, patterns in label_sets.items()]
+    matches: List[Tuple[str, str]] = []
     for idx, line in enumerate(lines):
-        for pat in label_patterns:
-            if re.search(pat, line, re.IGNORECASE):
-                start = idx if include_current else idx + 1
-                end = min(len(lines), start + max_lines)
-                snippet = "\n".join(ln.strip() for ln in lines[start:end] if ln.strip())
-                if snippet:
-                    matches.append(snippet)
+        for kind, label_regexes in groups:
+            for regex in label_regexes:
+                if regex.search(line):
+                    start = idx if include_current else idx + 1
+                    end = min(len(lines), start + max_lines)
+                    snippet = "\n".join(s for s in map(str.strip, lines[start:end]) if s)
+                    if snippet:
+                        matches.append((kind, snippet))
     return matches
 
 
+def window_after_labels(lines: Sequence[str], label_patterns: Sequence, max_lines: int = 4, include_current: bool = False) -> List[str]:
+    return [snippet for _, snippet in window_after_labels_multi(lines, {"": label_patterns}, max_lines, include_current)]
+
+
 def first_line(snippet: str) -> str:
     for line in snippet.splitlines():
         line = line.strip()
@@ -759,7 +799,7 @@ def first_line(snippet: str) -> str:
 
 
 def best_from_candidates(
-    candidates: Sequence[str],
+    candidates: Iterable[str],
     cleaner,
     validator=None,
 ) -> str:
@@ -775,31 +815,40 @@ def best_from_candidates(
     return ""
 
 
+_REL_OPTIONS = (
+    "spouse",
+    "husband",
+    "wife",
+    "son",
+    "daughter",
+    "brother",
+    "sister",
+    "mother",
+    "father",
+    "parent",
+    "grandson",
+    "granddaughter",
+    "niece",
+    "nephew",
+    "cousin",
+    "child",
+)
+_REL_LABELLED_RE = re.compile(r"(?i)relationship[^\n]{0,40}?\b(" + "|".join(_REL_OPTIONS) + r")\b")
+_REL_OPTION_RES = tuple((opt, re.compile(rf"(?i)\b{opt}\b")) for opt in _REL_OPTIONS)
+# re.IGNORECASE also folds these onto ASCII letters, which str.lower() does not.
+_FOLD_MISMATCH_CHARS = "\u017f\u0131\u0130"
+
+
 def extract_relationship(text: str) -> str:
-    options = [
-        "spouse",
-        "husband",
-        "wife",
-        "son",
-        "daughter",
-        "brother",
-        "sister",
-        "mother",
-        "father",
-        "parent",
-        "grandson",
-        "granddaughter",
-        "niece",
-        "nephew",
-        "cousin",
-        "child",
-    ]
-    rel_re = re.compile(r"(?i)relationship[^\n]{0,40}?\b(" + "|".join(options) + r")\b")
-    match = rel_re.search(text)
+    match = _REL_LABELLED_RE.search(text)
     if match:
         return match.group(1).title()
-    for opt in options:
-        if re.search(rf"(?i)\b{opt}\b", text):
+    # Options are tried in priority order over the whole text; a substring check on the lowered
+    # text rules most of them out without a regex scan.
+    lowered = lowered_text(text)
+    exact_only = any(ch in text for ch in _FOLD_MISMATCH_CHARS)
+    for opt, opt_re in _REL_OPTION_RES:
+        if (exact_only or opt in lowered) and opt_re.search(text):
             return opt.title()
     return ""
 
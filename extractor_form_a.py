@@ -1,5 +1,6 @@
 import re
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from extractor_base import (
     best_from_candidates,
@@ -22,13 +23,14 @@ from extractor_base import (
     plausible_name,
     split_lines,
     window_after_labels,
+    window_after_labels_multi,
     clean_address_strict,
     ROLE_BLACKLIST,
     REL_ALLOWED,
 )
 import difflib
 
-ALLOWED_REL = {
+ALLOWED_REL = frozenset({
     "spouse",
     "husband",
     "wife",
@@ -45,7 +47,11 @@ ALLOWED_REL = {
     "nephew",
     "cousin",
     "child",
-}
+})
+_NAME_TOKEN_RE = re.compile(r"[A-Za-z.'-]+")
+_NAME_AKA_RE = re.compile(r"(?i)(also\s+known\s+as|a\s*/?\s*k\s*/?\s*a|aka|alka|alkia)")
+_UNITED_STATES_RE = re.compile(r"(?i)\bunited\s+states\b")
+_SPACE_COMMA_RE = re.compile(r"\s+,")
 
 
 def _record(debug, field: str, source: str, value: str, score: int, status: str = "OK", reason: str = ""):
@@ -56,39 +62,33 @@ def _record(debug, field: str, source: str, value: str, score: int, status: str
     )
 
 
+@lru_cache(maxsize=2048)
 def _clean_text(val: str) -> str:
     if not val:
         return ""
     val = val.replace("_", " ")
     val = val.replace(" ,", ",")
-    val = re.sub(r"\s+,", ",", val)
-    val = re.sub(r"\s+", " ", val)
-    return val.strip(" :;,")
+    val = _SPACE_COMMA_RE.sub(",", val)
+    return " ".join(val.split()).strip(" :;,")
 
 
+@lru_cache(maxsize=2048)
 def _clean_name(raw: str) -> str:
     if not raw:
         return ""
     raw = raw.replace("_", " ")
-    raw = re.sub(r"(?i)\bunited\s+states\b", " ", raw)
-    raw = raw.strip(" )(")
-    raw = raw.strip(" )")
-    cut = raw
-    aka_match = re.search(r"(?i)(also\s+known\s+as|a\s*/?\s*k\s*/?\s*a|aka|alka|alkia)", cut)
+    raw = _UNITED_STATES_RE.sub(" ", raw)
+    cut = raw.strip(" )(")
+    aka_match = _NAME_AKA_RE.search(cut)
     if aka_match:
         cut = cut[: aka_match.start()]
-    cut = re.sub(r"[()\[\]]", " ", cut)
-    cut = re.sub(r"[^A-Za-z .'-]", " ", cut)
-    tokens = [t for t in re.split(r"\s+", cut) if t]
     cleaned_tokens: List[str] = []
-    for t in tokens:
+    for t in _NAME_TOKEN_RE.findall(cut):
         lower = t.lower().strip(" .,';-")
         if lower in {"jr", "sr"}:
             continue
         if "other" in lower and "specify" in lower:
             continue
-        if any(ch.isdigit() for ch in t):
-            return ""
         cleaned_tokens.append(t)
     while cleaned_tokens and cleaned_tokens[-1].lower().strip(" .,';-") in ALLOWED_REL:
         cleaned_tokens.pop()
@@ -170,15 +170,80 @@ def _align_last_name_to_decedent(petitioner: str, decedent: str) -> str:
     return petitioner
 
 
+# Tried in priority order: an earlier pattern anywhere in the text beats a later one.
+_DEC_SCAN_PATTERNS = (
+    re.compile(r"(?i)estate\s+of[:\s]+([A-Z][A-Za-z ,.'-]{2,})"),
+    re.compile(r"(?i)administration\s+proceeding[^\n]{0,40}estate\s+of[:\s]+([A-Z][A-Za-z ,.'-]{2,})"),
+    re.compile(r"(?i)probate\s+proceeding[^\n]{0,40}will\s+of[:\s]+([A-Z][A-Za-z ,.'-]{2,})"),
+    re.compile(r"(?is)decedent\s+information[^A-Za-z]{0,40}name[:\s]+([A-Z][A-Za-z ,.'-]{2,})"),
+)
+_STATE_ALT = r"(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)"
+_CITY_LINE_RE = re.compile(rf"(?im)^\s*([A-Z][A-Z .,'-]+)\s*{_STATE_ALT}?\s*(\d{{5}}(?:-\d{{4}})?)?\s*$")
+# Petitioner domicile block fields; none use anchors or \b, so they are searched
+# in place with pos/endpos rather than on sliced copies of the page.
+_DOMICILE_OFFICE_RE = re.compile(r"(?i)domicile\s+or\s+principal\s+office[:\s]+([^\n]+)")
+_CITY_LABEL_VALUE_RE = re.compile(r"(?i)(?:city|city,\s*village\s*or\s*town)[:\s]+([^\n]+)")
+_STATE_LABEL_VALUE_RE = re.compile(r"(?i)state[:\s]+([^\n]+)")
+_ZIP_LABEL_VALUE_RE = re.compile(r"(?i)zip\s*code[:\s]+(\d{5}(?:-\d{4})?)")
+_CITY_CAPTION_RE = re.compile(r"\n\s*([A-Za-z .'-]+)\s*\(City")
+_STATE_CAPTION_RE = re.compile(r"\n\s*([A-Za-z .'-]+)\s*\(State")
+_ZIP_CAPTION_RE = re.compile(r"\n\s*(\d{5}(?:-\d{4})?)\s*\(Zip")
+_MY_DOMICILE_RE = re.compile(
+    rf"(?i)my domicile is:\s*([A-Za-z0-9 ,.'-]+)\s+([A-Za-z .'-]+),\s*{_STATE_ALT}\s+(\d{{5}}(?:-\d{{4}})?)"
+)
+# The city/state/zip combos open with a greedy letter class, which backtracks
+# from every start position when no zip follows; only run them when a zip is present.
+_ZIP5_RE = re.compile(r"\d{5}")
+_CITY_STATE_ZIP_RE = re.compile(rf"(?i)([A-Za-z .'-]+)\s+{_STATE_ALT}\s+(\d{{5}}(?:-\d{{4}})?)")
+_CITY_COMMA_STATE_ZIP_RE = re.compile(rf"(?i)([A-Za-z .'-]+),?\s+{_STATE_ALT}\s+(\d{{5}}(?:-\d{{4}})?)")
+_LOOSE_CITY_STATE_ZIP_RE = re.compile(r"([A-Za-z .'-]+),?\s+([A-Za-z]{2,}|[A-Za-z ]+)\s+(\d{5}(?:-\d{4})?)")
+_ZIP_RE = re.compile(r"(\d{5}(?:-\d{4})?)")
+_DIGIT_RE = re.compile(r"\d")
+_INLINE_STREET_RE = re.compile(r":\s*([0-9][A-Za-z0-9 .,'/-]+)")
+_INLINE_CITY_RE = re.compile(r"(?i)city[^A-Za-z0-9]+([A-Za-z .'-]+)")
+_STATE_ZIP_LABEL_RE = re.compile(r"(?i)state[:\s]+([A-Za-z ]+)\s+zip\s*code\s*(\d{5}(?:-\d{4})?)")
+_PLACE_ZIP_RE = re.compile(r"([A-Za-z .'-]+)\s+(\d{5}(?:-\d{4})?)")
+_CITY_WORD_RE = re.compile(r"(?i)\bcity\b")
+_STATE_WORD_RE = re.compile(r"(?i)\bstate\b")
+_CITY_VALUE_RE = re.compile(r"(?i)city[^A-Za-z]*([A-Za-z .'-]+?)(?:,|\s+\d{5}|$)")
+_STATE_VALUE_RE = re.compile(r"(?i)\bstate\b[^:]*[ :\t]+([A-Za-z ]+)")
+
+_EMAIL_FULL = r"(?P<full>[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})"
+_EMAIL_OR_SPLIT_RE = re.compile(
+    rf"(?i){_EMAIL_FULL}|(?P<local>[A-Z0-9._%+-]+@[A-Z0-9.-]+)\s*\.?\s*(?P<tld>com|net|org|gov|edu|law)"
+)
+_EMAIL_OR_PARTIAL_RE = re.compile(rf"(?i){_EMAIL_FULL}|(?P<local>[A-Z0-9._%+-]+@[A-Z0-9.-]+)\s*\.?\s*(?P<tld>[A-Z]{{2,}})")
+_STATEN_ISLAND_RE = re.compile(r"(?i)staten\s+island")
+
+_PHONE_RE = re.compile(r"(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})")
+_TEL_NUMBER_PHONE_RE = re.compile(r"(?i)(telephone\s+number|tel(?:ephone)?)[^\d]{0,15}(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})")
+_TEL_PHONE_RE = re.compile(r"(?i)(telephone|tel)[^\d]{0,15}(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})")
+_TEL_NO_PHONE_RE = re.compile(r"(?i)(tel\s*no\.?|telephone)[^\d]{0,15}(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})")
+_MONEY_RE = re.compile(r"\$?\s*([0-9]{1,3}(?:,[0-9]{3})+(?:\.\d{2})?)")
+_ATT_SIGNATURE_RE = re.compile(r"(?i)signature of attorney[:\s]*")
+_PRINT_NAME_RE = re.compile(r"(?i)print name")
+_NAME_AFTER_LABEL_RE = re.compile(r"(?i)[:\s]*([A-Z .,'-]+)")
+_ATT_PRINT_NAME_RE = re.compile(r"(?i)print name of attorney[^A-Za-z]{0,30}([A-Z .,'-]{3,})")
+_ESQ_RE = re.compile(r"(?i)esq\.?")
+_ESQ_NAME_RE = re.compile(r"([A-Z .,'-]+?ESQ\.?)", re.IGNORECASE)
+_PRINT_NAME_VALUE_RE = re.compile(r"(?i)print name[:\s]+([A-Z .,'-]{3,})")
+_NAME_CAND_RE = re.compile(r"([A-Z][A-Za-z .,'-]{3,})")
+_NOTARY_NAME_RE = re.compile(r"([A-Z][A-Za-z .,'-]{3,})\s+Notary Public", re.IGNORECASE)
+# Name run after "Signature of Attorney": searching from the end of the first anchor
+# finds what the former DOTALL ``anchor.*?name`` pattern found, without the lazy sweep.
+_SIGNATURE_ANCHOR_LEN = len("Signature of Attorney")
+_SIGNATURE_NAME_RE = re.compile(r"([A-Z][A-Za-z .,'-]{3,})", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_ATT_ANCHOR_RE = re.compile(r"(?P<notary>Notary Public)|(?P<sig>Signature of Attorney)", re.IGNORECASE)
+_RELATIONSHIP_LABEL_RE = re.compile(
+    r"relationship[^A-Za-z]{0,20}(spouse|husband|wife|son|daughter|child|mother|father|sister|brother|niece|nephew|grandchild|grandson|granddaughter)",
+    re.IGNORECASE,
+)
+
+
 def _strict_decedent_name_scan(text: str) -> str:
-    patterns = [
-        r"(?i)estate\s+of[:\s]+([A-Z][A-Za-z ,.'-]{2,})",
-        r"(?i)administration\s+proceeding[^\\n]{0,40}estate\s+of[:\s]+([A-Z][A-Za-z ,.'-]{2,})",
-        r"(?i)probate\s+proceeding[^\\n]{0,40}will\s+of[:\s]+([A-Z][A-Za-z ,.'-]{2,})",
-        r"(?is)decedent\s+information[^A-Za-z]{0,40}name[:\s]+([A-Z][A-Za-z ,.'-]{2,})",
-    ]
-    for pat in patterns:
-        m = re.search(pat, text)
+    for pat in _DEC_SCAN_PATTERNS:
+        m = pat.search(text)
         if m:
             cand = _clean_name(m.group(1))
             if cand:
@@ -188,15 +253,16 @@ def _strict_decedent_name_scan(text: str) -> str:
 
 def _strict_decedent_address_scan(text: str) -> str:
     anchors = ["domicile address", "domicile: street", "domicile:", "address of decedent", "domicile address: street and number"]
+    text_lower = text.lower()
     for anchor in anchors:
-        pos = text.lower().find(anchor)
+        pos = text_lower.find(anchor)
         if pos != -1:
             window = text[max(0, pos - 50) : pos + 300]
             addrs = find_addresses(window)
             if addrs:
                 return pick_best_address(addrs)
     # fallback: any address near "decedent"
-    pos = text.lower().find("decedent")
+    pos = text_lower.find("decedent")
     if pos != -1:
         window = text[max(0, pos - 50) : pos + 400]
         addrs = find_addresses(window)
@@ -205,6 +271,12 @@ def _strict_decedent_address_scan(text: str) -> str:
     return ""
 
 
+_CITIZENSHIP_RE = r"\b(?:united\s+states|usa)\b"
+# Citizenship and label words removed from block city/state values in one pass
+_CITY_NOISE_RE = re.compile(rf"(?i){_CITIZENSHIP_RE}|\b(?:city|village|town|or)\b")
+_STATE_NOISE_RE = re.compile(rf"(?i){_CITIZENSHIP_RE}|state|zip.*")
+
+
 def _strip_citizenship(val: str) -> str:
     return re.sub(r"(?i)\b(united\s+states|usa)\b", "", val).strip(" ,")
 
@@ -237,11 +309,29 @@ def _normalize_state_value(val: str) -> str:
     return cleaned.title()
 
 
+_DEC_NAME_STOP = r"(?=\s+(?:a/k/a|aka|also known|alkia|alk/a|letters|petition|file|deceased|$))"
+# Page-1 caption patterns, strongest first: (pattern, score, source)
+_DEC_NAME_PG1_PATTERNS = (
+    (re.compile(rf"(?im)probate proceeding,?\s*will of[:\s_]+([^\n]+?){_DEC_NAME_STOP}"), 125, "will_of_header_strict"),
+    (re.compile(rf"(?im)will of[:\s_]+([^\n]+?){_DEC_NAME_STOP}"), 120, "will_of_pg1"),
+    (re.compile(r"(?im)will of[:\s_]+([^\n]+)"), 118, "will_of_pg1_relaxed"),
+    (re.compile(rf"(?im)estate of[:\s_]+([^\n]+?){_DEC_NAME_STOP}"), 115, "estate_of_pg1"),
+)
+_DEC_NAME_TAIL_RE = re.compile(r"(?i)\b(letters|temporary|petition|file no|deceased)")
+_NON_ALPHA_RE = re.compile(r"[^A-Za-z]")
+_DEC_BLOCK_RE = re.compile(r"(?is)the name, domicile.*?as\s+follows:(.{0,800})")
+_NAME_LINE_RE = re.compile(r"(?i)name[:\s]+([^\n]+)")
+_SECTION2_NAME_RE = re.compile(r"(?is)2[^\\n]{0,80}?name[:\\s]+([^\\n]+)")
+_DEC_INFO_NAME_RE = re.compile(r"(?is)decedent information[:\s].{0,120}?name[:\s]+([^\n]+)")
+_ALIAS_RE = re.compile(r"(?is)(?:a/k/a|aka|also known as)\s+([A-Za-z .'-]+)")
+_ALIAS_TAIL_RE = re.compile(r"(?i)(letters|trusteeship|temporary|petition)")
+
+
 def _extract_deceased_name(text: str, pages_text: Optional[List[str]], debug=None) -> str:
     candidates: List[tuple[int, str]] = []
 
     def add(raw: str, source: str, score: int):
-        raw = re.split(r"(?i)\b(letters|temporary|petition|file no|deceased)", raw)[0]
+        raw = _DEC_NAME_TAIL_RE.split(raw)[0]
         cleaned = _clean_name(raw)
         if not cleaned:
             return
@@ -251,7 +341,7 @@ def _extract_deceased_name(text: str, pages_text: Optional[List[str]], debug=Non
             cleaned = " ".join(tokens[:-1])
         if not cleaned:
             return
-        alpha_len = len(re.sub(r"[^A-Za-z]", "", cleaned))
+        alpha_len = len(_NON_ALPHA_RE.sub("", cleaned))
         if alpha_len < 4:
             _record(debug, "Deceased Name", source, cleaned, score, status="SKIP", reason="too_short")
             return
@@ -268,44 +358,23 @@ def _extract_deceased_name(text: str, pages_text: Optional[List[str]], debug=Non
     page2 = pages_text[1] if pages_text and len(pages_text) >= 2 else ""
 
     if page1:
-        for pat, score, label in [
-            (
-                r"(?im)probate proceeding,?\s*will of[:\s_]+([^\n]+?)(?=\s+(?:a/k/a|aka|also known|alkia|alk/a|letters|petition|file|deceased|$))",
-                125,
-                "will_of_header_strict",
-            ),
-            (
-                r"(?im)will of[:\s_]+([^\n]+?)(?=\s+(?:a/k/a|aka|also known|alkia|alk/a|letters|petition|file|deceased|$))",
-                120,
-                "will_of_pg1",
-            ),
-            (
-                r"(?im)will of[:\s_]+([^\n]+)",
-                118,
-                "will_of_pg1_relaxed",
-            ),
-            (
-                r"(?im)estate of[:\s_]+([^\n]+?)(?=\s+(?:a/k/a|aka|also known|alkia|alk/a|letters|petition|file|deceased|$))",
-                115,
-                "estate_of_pg1",
-            ),
-        ]:
-            for m in re.finditer(pat, page1):
+        for pat, score, label in _DEC_NAME_PG1_PATTERNS:
+            for m in pat.finditer(page1):
                 add(m.group(1), label, score)
-        dec_block = re.search(r"(?is)the name, domicile.*?as\s+follows:(.{0,800})", page1)
+        dec_block = _DEC_BLOCK_RE.search(page1)
         if dec_block:
-            m = re.search(r"(?i)name[:\s]+([^\n]+)", dec_block.group(1))
+            m = _NAME_LINE_RE.search(dec_block.group(1))
             if m:
                 add(m.group(1), "decedent_block_pg1", 110)
 
     if not candidates and page2:
-        m = re.search(r"(?is)2[^\\n]{0,80}?name[:\\s]+([^\\n]+)", page2)
+        m = _SECTION2_NAME_RE.search(page2)
         if m:
             add(m.group(1), "section_2_pg2_name", 95)
 
     if not candidates and pages_text:
         for idx, page in enumerate(pages_text):
-            m = re.search(r"(?is)decedent information[:\s].{0,120}?name[:\s]+([^\n]+)", page)
+            m = _DEC_INFO_NAME_RE.search(page)
             if m:
                 add(m.group(1), f"decedent_information_pg{idx+1}", 75)
                 break
@@ -315,9 +384,9 @@ def _extract_deceased_name(text: str, pages_text: Optional[List[str]], debug=Non
         best = candidates[0][1]
         # detect alias but keep output as primary name only (per finalized rules)
         search_scope = " ".join(pages_text[:2]) if pages_text else text
-        m_alias = re.search(r"(?is)(?:a/k/a|aka|also known as)\s+([A-Za-z .'-]+)", search_scope)
+        m_alias = _ALIAS_RE.search(search_scope)
         if m_alias:
-            raw_alias = re.split(r"(?i)(letters|trusteeship|temporary|petition)", m_alias.group(1))[0]
+            raw_alias = _ALIAS_TAIL_RE.split(m_alias.group(1))[0]
             alias_clean = _clean_name(raw_alias)
             if alias_clean and alias_clean.lower() != best.lower():
                 _record(debug, "Deceased Name", "alias_detected", alias_clean, candidates[0][0], status="INFO")
@@ -327,7 +396,7 @@ def _extract_deceased_name(text: str, pages_text: Optional[List[str]], debug=Non
 
     fallback = _clean_name(extract_deceased_name(text))
     if fallback:
-        alpha_len = len(re.sub(r"[^A-Za-z]", "", fallback))
+        alpha_len = len(_NON_ALPHA_RE.sub("", fallback))
         if alpha_len < 4 or is_label_noise(fallback):
             _record(debug, "Deceased Name", "generic_fallback", fallback, 5, status="SKIP", reason="invalid_name")
             return ""
@@ -338,10 +407,23 @@ def _extract_deceased_name(text: str, pages_text: Optional[List[str]], debug=Non
         return fallback
 
 
+def _nonempty_stripped(lines: Sequence[str]) -> List[str]:
+    # Strip each line once; the old filter-then-strip comprehension stripped twice.
+    return [s for s in map(str.strip, lines) if s]
+
+
+@lru_cache(maxsize=32)
+def _page_lines(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    # Several extractors anchor on the same page; split and lowercase it only once.
+    lines = tuple(ln.strip() for ln in text.splitlines())
+    return lines, tuple(ln.lower() for ln in lines)
+
+
 def find_block_after_label(text: str, label: str, max_lines: int = 10) -> List[str]:
-    lines = [ln.strip() for ln in text.splitlines()]
-    for idx, line in enumerate(lines):
-        if label.lower() in line.lower():
+    lines, lines_lower = _page_lines(text)
+    label_lower = label.lower()
+    for idx, line_lower in enumerate(lines_lower):
+        if label_lower in line_lower:
             block = []
             for ln in lines[idx + 1 : idx + 1 + max_lines]:
                 if not ln:
@@ -365,8 +447,9 @@ def extract_name_after_label(block: List[str], label: str = "Name") -> str:
         r"\bzip\b",
         r"\bcountry\b",
     ]
+    label_lower = label.lower()
     for idx, line in enumerate(block):
-        if label.lower() in line.lower():
+        if label_lower in line.lower():
             for j in range(idx + 1, min(len(block), idx + 6)):
                 candidate = block[j].strip()
                 if not candidate:
@@ -388,72 +471,89 @@ def extract_name_after_label(block: List[str], label: str = "Name") -> str:
     return ""
 
 
+# Lines that end an address block (fiduciary/relationship sections follow it)
+_BOUNDARY_TERMS = (
+    "description of legacy",
+    "devise",
+    "other interest",
+    "nature of fiduciary status",
+    "beneficiary",
+    "executor",
+    "trustee",
+    "distributee",
+    "relationship",
+    "citizenship",
+    "interest(s) of petitioner",
+)
+_BOUNDARY_RE = re.compile("|".join(re.escape(term) for term in _BOUNDARY_TERMS))
+
+
+@lru_cache(maxsize=256)
+def _city_state_zip_pattern(city_clean: str):
+    return re.compile(
+        rf"{re.escape(city_clean)}[^\n]{{0,40}}{_STATE_ALT}[^\d]{{0,10}}(\d{{5}}(?:-\d{{4}})?)",
+        re.IGNORECASE,
+    )
+
+
 def _fill_city_state_zip(city: str, state: str, zip_code: str, pages_text: Optional[List[str]]) -> (str, str, str):
     city_clean = city.strip()
     if (state and zip_code) or not city_clean or not pages_text:
         return city, state, zip_code
-    search_space = "\n".join(pages_text)
-    m = re.search(
-        rf"{re.escape(city_clean)}[^\n]{{0,40}}(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)[^\d]{{0,10}}(\d{{5}}(?:-\d{{4}})?)",
-        search_space,
-        re.IGNORECASE,
-    )
-    if m:
-        return city, m.group(1), m.group(2)
+    pattern = _city_state_zip_pattern(city_clean)
+    for page in pages_text:
+        m = pattern.search(page)
+        if m:
+            return city, m.group(1), m.group(2)
     return city, state, zip_code
 
 
+@lru_cache(maxsize=8)
+def _joined_pages(pages: Tuple[str, ...]) -> str:
+    # Space-joined document, built once per document
+    return " ".join(pages)
+
+
+@lru_cache(maxsize=8)
+def _addresses_in_pages(pages: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Whole-document address scan shared by the street/zip upgrade fallbacks
+    return tuple(find_addresses(_joined_pages(pages)))
+
+
 def extract_address_from_block(block: List[str], pages_text: Optional[List[str]], debug: Optional[dict], field: str) -> str:
     street = city = state = zip_code = ""
-    boundary_terms = [
-        "description of legacy",
-        "devise",
-        "other interest",
-        "nature of fiduciary status",
-        "beneficiary",
-        "executor",
-        "trustee",
-        "distributee",
-        "relationship",
-        "citizenship",
-        "interest(s) of petitioner",
-    ]
     for idx, line in enumerate(block):
         low = line.lower()
-        if any(term in low for term in boundary_terms):
+        if _BOUNDARY_RE.search(low):
             break
         if any(lbl in low for lbl in ["domicile address", "principal office", "street and number"]):
-            inline_street = re.search(r":\s*([0-9][A-Za-z0-9 .,'/-]+)", line)
+            inline_street = _INLINE_STREET_RE.search(line)
             if inline_street:
                 street = inline_street.group(1).strip()
             for j in range(idx + 1, min(len(block), idx + 6)):
                 lowj = block[j].lower()
-                if any(term in lowj for term in boundary_terms):
+                if _BOUNDARY_RE.search(lowj):
                     break
-                if re.search(r"\d", block[j]) and any(
+                if _DIGIT_RE.search(block[j]) and any(
                     kw in lowj for kw in ["road", "street", "lane", "drive", "avenue", "blvd", "court", "place", "pl", "pkwy", "way"]
                 ):
                     street = block[j]
                     break
-        if not street and re.search(r"\d", line) and any(
+        if not street and _DIGIT_RE.search(line) and any(
             kw in low for kw in ["road", "street", "lane", "drive", "avenue", "blvd", "court", ","]
         ):
             street = line
         if "city" in low and ("village" in low or "town" in low or "city" in low):
-            inline_city = re.search(r"(?i)city[^A-Za-z0-9]+([A-Za-z .'-]+)", line)
+            inline_city = _INLINE_CITY_RE.search(line)
             if inline_city:
                 city = city or inline_city.group(1).strip()
             if idx + 1 < len(block) and not city:
                 city_line = block[idx + 1]
                 if "zip" in city_line.lower() or "state" in city_line.lower():
                     continue
-                if any(term in city_line.lower() for term in boundary_terms):
+                if _BOUNDARY_RE.search(city_line.lower()):
                     continue
-                combo = re.search(
-                    r"([A-Za-z .'-]+),?\s+([A-Za-z]{2,}|[A-Za-z ]+)\s+(\d{5}(?:-\d{4})?)",
-                    city_line,
-                    re.IGNORECASE,
-                )
+                combo = _LOOSE_CITY_STATE_ZIP_RE.search(city_line)
                 if combo:
                     city = combo.group(1)
                     state = combo.group(2)
@@ -462,15 +562,15 @@ def extract_address_from_block(block: List[str], pages_text: Optional[List[str]]
                     city = city_line
         if ("state zip code" in low or ("state" in low and "zip" in low)):
             # try same line first
-            mself = re.search(r"state[:\s]+([A-Za-z ]+)\s+zip\s*code\s*(\d{5}(?:-\d{4})?)", line, re.IGNORECASE)
+            mself = _STATE_ZIP_LABEL_RE.search(line)
             if mself:
                 state = state or mself.group(1)
                 zip_code = zip_code or mself.group(2)
             if idx + 1 < len(block) and (not state or not zip_code):
                 nxt = block[idx + 1]
-                if any(term in nxt.lower() for term in boundary_terms):
+                if _BOUNDARY_RE.search(nxt.lower()):
                     continue
-                m = re.search(r"([A-Za-z .'-]+)\s+(\d{5}(?:-\d{4})?)", nxt, re.IGNORECASE)
+                m = _PLACE_ZIP_RE.search(nxt)
                 if m:
                     state = state or m.group(1)
                     zip_code = zip_code or m.group(2)
@@ -478,44 +578,37 @@ def extract_address_from_block(block: List[str], pages_text: Optional[List[str]]
         for ln in block:
             if "state" in ln.lower() and "zip" in ln.lower():
                 continue
-            if any(term in ln.lower() for term in boundary_terms):
+            if _BOUNDARY_RE.search(ln.lower()):
                 continue
-            combo = re.search(
-                r"([A-Za-z .'-]+),?\s+([A-Za-z]{2,}|[A-Za-z ]+)\s+(\d{5}(?:-\d{4})?)",
-                ln,
-                re.IGNORECASE,
-            )
+            combo = _LOOSE_CITY_STATE_ZIP_RE.search(ln)
             if combo:
                 city = city or combo.group(1)
                 state = state or combo.group(2)
                 zip_code = zip_code or combo.group(3)
                 break
     street = _strip_citizenship(street)
-    city = _strip_citizenship(city)
-    city = re.sub(r"(?i)\b(city|village|town|or)\b", "", city).strip(" ,")
-    state = _strip_citizenship(state)
-    state = re.sub(r"(?i)state", "", state)
-    state = re.sub(r"(?i)zip.*", "", state).strip(" ,")
+    city = _CITY_NOISE_RE.sub("", city).strip(" ,")
+    state = _STATE_NOISE_RE.sub("", state).strip(" ,")
     city, state, zip_code = _fill_city_state_zip(city, state, zip_code, pages_text)
     addr = _assemble_address(street, city, state, zip_code)
     if addr and (city or state or zip_code):
         cleaned = clean_address_strict(addr, field=field, debug=debug)
-        if cleaned and re.search(r"\d", cleaned) and re.search(r"\d{5}", cleaned):
+        if cleaned and _ZIP5_RE.search(cleaned):
             _record(debug, field, "anchored_block", cleaned, 120)
             return cleaned
         # augment with any address containing the same street to recover missing zip
         if street:
-            combined_text = " ".join(pages_text or [])
-            all_addrs = find_addresses(combined_text)
+            all_addrs = _addresses_in_pages(tuple(pages_text or []))
             street_tokens = street.split()
             prefix = " ".join(street_tokens[:2]) if len(street_tokens) >= 2 else street_tokens[0] if street_tokens else ""
+            prefix_lower = prefix.lower()
             for cand in all_addrs:
-                if prefix and prefix.lower() in cand.lower():
+                if prefix_lower and prefix_lower in cand.lower():
                     cand_clean = clean_address_strict(cand, field=field, debug=debug)
-                    if cand_clean and re.search(r"\d{5}", cand_clean):
+                    if cand_clean and _ZIP5_RE.search(cand_clean):
                         _record(debug, field, "street_match_fallback", cand_clean, 80)
                         return cand_clean
-        if cleaned and re.search(r"\d", cleaned):
+        if cleaned and _DIGIT_RE.search(cleaned):
             _record(debug, field, "anchored_block_nozip", cleaned, 60)
             return cleaned
     return ""
@@ -523,6 +616,7 @@ def extract_address_from_block(block: List[str], pages_text: Optional[List[str]]
 
 def _extract_petitioner_name(text: str, pages_text: Optional[List[str]], debug=None) -> str:
     names: List[str] = []
+    names_lower = set()
     page1 = pages_text[0] if pages_text and len(pages_text) >= 1 else ""
     page3 = pages_text[2] if pages_text and len(pages_text) >= 3 else ""
     last_page = pages_text[-1] if pages_text else ""
@@ -531,9 +625,11 @@ def _extract_petitioner_name(text: str, pages_text: Optional[List[str]], debug=N
         cleaned = _clean_name(raw)
         if not cleaned:
             return
-        if any(cleaned.lower() == n.lower() for n in names):
+        cleaned_lower = cleaned.lower()
+        if cleaned_lower in names_lower:
             return
         names.append(cleaned)
+        names_lower.add(cleaned_lower)
         _record(debug, "Petitioner Name", source, cleaned, score)
 
     if page1:
@@ -571,6 +667,7 @@ def _extract_petitioner_name(text: str, pages_text: Optional[List[str]], debug=N
         cleaned = _clean_name(fallback)
         if cleaned:
             names.append(cleaned)
+            names_lower.add(cleaned.lower())
             _record(debug, "Petitioner Name", "generic_fallback", cleaned, 10)
 
     # Additional fail-safes
@@ -606,10 +703,10 @@ def _extract_petitioner_address(text: str, pages_text: Optional[List[str]], peti
             city = ""
             state = ""
             zip_code = ""
-            m_dom = re.search(r"(?i)domicile\s+or\s+principal\s+office[:\s]+([^\n]+)", scope)
+            m_dom = _DOMICILE_OFFICE_RE.search(page1, para1.start(), para1.end())
             if m_dom:
                 street = m_dom.group(1)
-            m_cityline = re.search(r"(?im)^\s*([A-Z][A-Z .,'-]+)\s*(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)?\s*(\d{5}(?:-\d{4})?)?\s*$", scope, re.MULTILINE)
+            m_cityline = _CITY_LINE_RE.search(scope)
             if m_cityline:
                 city = m_cityline.group(1)
                 if m_cityline.group(2):
@@ -626,10 +723,7 @@ def _extract_petitioner_address(text: str, pages_text: Optional[List[str]], peti
                 return cleaned
 
     if last_page:
-        m = re.search(
-            r"(?i)my domicile is:\s*([A-Za-z0-9 ,.'-]+)\s+([A-Za-z .'-]+),\s*(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5}(?:-\d{4})?)",
-            last_page,
-        )
+        m = _MY_DOMICILE_RE.search(last_page)
         if m:
             addr = _assemble_address(m.group(1), m.group(2), m.group(3), m.group(4))
             cleaned = clean_address_strict(addr, field="Petitioner Address", debug=debug)
@@ -643,10 +737,11 @@ def _extract_petitioner_address(text: str, pages_text: Optional[List[str]], peti
         )
         if block_match:
             block = block_match.group(1)
-            street = re.search(r"(?i)domicile\s+or\s+principal\s+office[:\s]+([^\n]+)", block)
-            city = re.search(r"(?i)(?:city|city,\s*village\s*or\s*town)[:\s]+([^\n]+)", block)
-            state = re.search(r"(?i)state[:\s]+([^\n]+)", block)
-            zip_code = re.search(r"(?i)zip\s*code[:\s]+(\d{5}(?:-\d{4})?)", block)
+            block_start, block_end = block_match.span(1)
+            street = _DOMICILE_OFFICE_RE.search(page1, block_start, block_end)
+            city = _CITY_LABEL_VALUE_RE.search(page1, block_start, block_end)
+            state = _STATE_LABEL_VALUE_RE.search(page1, block_start, block_end)
+            zip_code = _ZIP_LABEL_VALUE_RE.search(page1, block_start, block_end)
             addr = _assemble_address(
                 street.group(1) if street else "",
                 city.group(1) if city else "",
@@ -656,15 +751,14 @@ def _extract_petitioner_address(text: str, pages_text: Optional[List[str]], peti
             if addr and (city or state or zip_code):
                 _record(debug, "Petitioner Address", "domicile_block_pg1", addr, 100)
                 return addr
-            lines = [ln.strip() for ln in block.splitlines() if ln.strip()]
+            lines = _nonempty_stripped(block.splitlines())
             if lines:
                 street_line = lines[0]
                 street_line = re.sub(r"(?i).*domicile[^:]*:\s*", "", street_line)
                 for ln in lines[1:]:
-                    m = re.search(
-                        r"(?i)([A-Za-z .'-]+)\s+(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5}(?:-\d{4})?)",
-                        ln,
-                    )
+                    if not _ZIP5_RE.search(ln):
+                        continue
+                    m = _CITY_STATE_ZIP_RE.search(ln)
                     if m:
                         city = m.group(1)
                         state = m.group(2)
@@ -675,11 +769,11 @@ def _extract_petitioner_address(text: str, pages_text: Optional[List[str]], peti
                             return addr
         start = page1.lower().find("domicile or principal office")
         if start != -1:
-            window = page1[start : start + 500]
-            street = re.search(r"(?i)domicile\s+or\s+principal\s+office[:\s]+([^\n]+)", window)
-            city = re.search(r"\n\s*([A-Za-z .'-]+)\s*\(City", window)
-            state = re.search(r"\n\s*([A-Za-z .'-]+)\s*\(State", window)
-            zip_code = re.search(r"\n\s*(\d{5}(?:-\d{4})?)\s*\(Zip", window)
+            end = start + 500
+            street = _DOMICILE_OFFICE_RE.search(page1, start, end)
+            city = _CITY_CAPTION_RE.search(page1, start, end)
+            state = _STATE_CAPTION_RE.search(page1, start, end)
+            zip_code = _ZIP_CAPTION_RE.search(page1, start, end)
             addr = _assemble_address(
                 street.group(1) if street else "",
                 city.group(1) if city else "",
@@ -708,7 +802,6 @@ def _extract_petitioner_address(text: str, pages_text: Optional[List[str]], peti
 def _extract_deceased_address(text: str, pages_text: Optional[List[str]], debug=None) -> str:
     pages_text = pages_text or []
     page1 = pages_text[0] if pages_text else ""
-    state_pattern = r"(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)"
 
     def _clean_place_name(val: str) -> str:
         val = re.sub(r"(?i)\b(city|town|village|county)\b[^A-Za-z]*", "", val or "")
@@ -735,7 +828,7 @@ def _extract_deceased_address(text: str, pages_text: Optional[List[str]], debug=
             zip_match = re.search(r"(?i)zip[^:\n]*[:\s]+(\d{5}(?:-\d{4})?)", block)
             if zip_match:
                 zip_code = zip_match.group(1)
-            lines = [ln.strip() for ln in block.splitlines() if ln.strip()]
+            lines = _nonempty_stripped(block.splitlines())
             for ln in lines:
                 low = ln.lower()
                 if low.startswith("city"):
@@ -752,8 +845,8 @@ def _extract_deceased_address(text: str, pages_text: Optional[List[str]], debug=
                     m_zip = re.search(r"(?i)(\d{5}(?:-\d{4})?)", ln)
                     if m_zip:
                         zip_code = m_zip.group(1)
-            if (not city or not state) and block:
-                combo = re.search(rf"([A-Za-z .'-]+)\s+{state_pattern}\s+(\d{{5}}(?:-\d{{4}})?)", block, re.IGNORECASE)
+            if (not city or not state) and _ZIP5_RE.search(block):
+                combo = _CITY_STATE_ZIP_RE.search(block)
                 if combo:
                     city = city or combo.group(1)
                     state = state or combo.group(2)
@@ -765,19 +858,19 @@ def _extract_deceased_address(text: str, pages_text: Optional[List[str]], debug=
             addr = _assemble_address(street, city, state, zip_code)
             cleaned = clean_address_strict(addr, field="Deceased Property Address", debug=debug)
             if cleaned and (city or state):
-                has_zip = bool(re.search(r"\d{5}", cleaned))
+                has_zip = bool(_ZIP5_RE.search(cleaned))
                 if has_zip:
                     _record(debug, "Deceased Property Address", "decedent_block_pg1", cleaned, 115)
                     return cleaned
                 # try to upgrade with any address containing same street and a zip
                 street_tokens = street.split()
                 prefix = " ".join(street_tokens[:2]) if len(street_tokens) >= 2 else street_tokens[0] if street_tokens else ""
-                combined_text = " ".join(pages_text or [])
-                all_addrs = find_addresses(combined_text)
+                all_addrs = _addresses_in_pages(tuple(pages_text or []))
+                prefix_lower = prefix.lower()
                 for cand in all_addrs:
-                    if prefix and prefix.lower() in cand.lower():
+                    if prefix_lower and prefix_lower in cand.lower():
                         cand_clean = clean_address_strict(cand, field="Deceased Property Address", debug=debug)
-                        if cand_clean and re.search(r"\d{5}", cand_clean):
+                        if cand_clean and _ZIP5_RE.search(cand_clean):
                             _record(debug, "Deceased Property Address", "decedent_block_pg1_zip_upgrade", cand_clean, 116)
                             return cand_clean
                 _record(debug, "Deceased Property Address", "decedent_block_pg1_nozip", cleaned, 60)
@@ -800,20 +893,23 @@ def _extract_deceased_address(text: str, pages_text: Optional[List[str]], debug=
         state_match = None
         zip_match = None
         for ln in window.splitlines():
-            if not city_match and re.search(r"(?i)\bcity\b", ln):
-                mcity = re.search(r"(?i)city[^A-Za-z]*([A-Za-z .'-]+?)(?:,|\s+\d{5}|$)", ln)
+            ln_low = ln.lower()
+            if not city_match and "city" in ln_low and _CITY_WORD_RE.search(ln):
+                mcity = _CITY_VALUE_RE.search(ln)
                 if mcity:
                     city_match = mcity
-                mzip_inline = re.search(r"(\d{5}(?:-\d{4})?)", ln)
+                mzip_inline = _ZIP_RE.search(ln)
                 if mzip_inline:
                     zip_match = mzip_inline
-            if not state_match and re.search(r"(?i)\bstate\b", ln):
-                state_match = re.search(r"(?i)\bstate\b[^:]*[ :\t]+([A-Za-z ]+)", ln)
+            if not state_match and "state" in ln_low and _STATE_WORD_RE.search(ln):
+                state_match = _STATE_VALUE_RE.search(ln)
             if not zip_match:
-                mzip = re.search(r"(\d{5}(?:-\d{4})?)", ln)
+                mzip = _ZIP_RE.search(ln)
                 if mzip:
                     zip_match = mzip
-        combo = re.search(rf"([A-Za-z .'-]+),?\s+{state_pattern}\s+(\d{{5}}(?:-\d{{4}})?)", window, re.IGNORECASE)
+        combo = None
+        if _ZIP5_RE.search(window):
+            combo = _CITY_COMMA_STATE_ZIP_RE.search(window)
         street_line = _strip_citizenship(street_line)
         city_val = _clean_place_name(_strip_citizenship(city_match.group(1))) if city_match else (combo.group(1) if combo else "")
         state_val = _normalize_state_value(_clean_place_name(_strip_citizenship(state_match.group(1)))) if state_match else (combo.group(2) if combo else "")
@@ -823,13 +919,10 @@ def _extract_deceased_address(text: str, pages_text: Optional[List[str]], debug=
             pre_city = re.search(rf"([A-Za-z][A-Za-z .'-]+),?\s+{zip_match.group(1)}", window)
             if pre_city:
                 city_val = pre_city.group(1)
-        if not city_val and re.search(r"(?i)staten\s+island", window):
-            city_val = "Staten Island"
-        if not city_val and re.search(r"(?i)staten\s+island", page):
+        # window is a slice of page, so one page-wide check covers both
+        if not city_val and _STATEN_ISLAND_RE.search(page):
             city_val = "Staten Island"
-        if not state_val and re.search(r"(?i)new york", window):
-            state_val = "NY"
-        if not state_val and re.search(r"(?i)new york", window):
+        if not state_val and "new york" in window.lower():
             state_val = "NY"
         city_val = re.sub(r"(?i)\b(city|town|village|county)\b[^A-Za-z]*", "", city_val or "").strip(" ,")
         addr = _assemble_address(
@@ -849,7 +942,7 @@ def _extract_deceased_address(text: str, pages_text: Optional[List[str]], debug=
     if near:
         candidates.append(near)
         _record(debug, "Deceased Property Address", "near_domicile_keyword", near, 40)
-    candidates.extend(find_addresses(" ".join(pages_text or []) if pages_text else text))
+    candidates.extend(_addresses_in_pages(tuple(pages_text)) if pages_text else find_addresses(text))
     best = _clean_text(pick_best_address(candidates))
     if best:
         cleaned = clean_address_strict(best, field="Deceased Property Address", debug=debug)
@@ -859,6 +952,39 @@ def _extract_deceased_address(text: str, pages_text: Optional[List[str]], debug=
     return ""
 
 
+# Substring prefilters for role words and relationship tokens on lowercased lines
+_ROLE_RE = re.compile("|".join(re.escape(role) for role in sorted(ROLE_BLACKLIST)))
+_REL_TOKEN_RE = re.compile(
+    "spouse|husband|wife|son|daughter|child|sister|brother|mother|father|niece|nephew|grandchild|grandson|granddaughter"
+)
+# Beneficiary/distributee table headings; relationship words on those pages belong to other parties
+_TABLE_MARKER_RE = re.compile(
+    "description of legacy|other interest|nature of fiduciary status|legatee|beneficiary"
+    "|all persons and parties so interested|full residuary legatee|nominated executor|successor executor"
+)
+# Relationship word classes for name lines, listed in priority order
+_REL_LINE_CLASSES = (
+    ("spouse", ("Spouse", 60)),
+    ("child", ("Child", 55)),
+    ("sibling", ("Sibling", 50)),
+    ("parent", ("Parent", 50)),
+    ("grand", ("Grandchild", 45)),
+    ("niece", ("Niece", 45)),
+    ("cousin", ("Cousin", 40)),
+)
+_REL_LINE_CLASS_RE = re.compile(
+    r"(?P<spouse>\b(?:spouse|husband|wife|widow|widower)\b)"
+    r"|(?P<child>\b(?:son|daughter|child)\b)"
+    r"|(?P<sibling>\b(?:sister|brother)\b)"
+    r"|(?P<parent>\b(?:mother|father|parent)\b)"
+    r"|(?P<grand>\bgrandchild\b)"
+    r"|(?P<niece>\b(?:niece|nephew)\b)"
+    r"|(?P<cousin>\bcousin\b)"
+)
+# Ordered lookup; REL_ALLOWED already includes wife/husband.
+_REL_OPT_PATTERNS = [(opt, re.compile(rf"(?i)\b{re.escape(opt)}\b")) for opt in REL_ALLOWED]
+
+
 def _find_relationship_in_lines(lines: List[str], idx: int) -> str:
     for offset in (0, 1):
         pos = idx + offset
@@ -866,16 +992,18 @@ def _find_relationship_in_lines(lines: List[str], idx: int) -> str:
             continue
         line = lines[pos]
         low_line = line.lower()
-        has_role = any(role in low_line for role in ROLE_BLACKLIST)
-        has_rel_token = any(re.search(rf"(?i)\b{re.escape(opt)}\b", line) for opt in REL_ALLOWED + ["wife", "husband"])
-        if has_role and not has_rel_token:
+        rel = ""
+        for opt, opt_re in _REL_OPT_PATTERNS:
+            # substring check first; the word-boundary regex only runs on likely hits
+            if opt in low_line and opt_re.search(line):
+                rel = opt
+                break
+        if not rel:
             continue
-        for opt in REL_ALLOWED:
-            if re.search(rf"(?i)\b{re.escape(opt)}\b", line):
-                norm = opt.title()
-                if norm.lower() == "wife" or norm.lower() == "husband":
-                    norm = "Spouse"
-                return norm
+        norm = rel.title()
+        if norm.lower() == "wife" or norm.lower() == "husband":
+            norm = "Spouse"
+        return norm
     return ""
 
 
@@ -883,15 +1011,11 @@ def _strict_relationship_scan(text: str, petitioner_name: str = "") -> str:
     """
     Second-pass scan across the whole document for relationship labels, filtered by role blacklist.
     """
-    pattern = re.compile(
-        r"relationship[^A-Za-z]{0,20}(spouse|husband|wife|son|daughter|child|mother|father|sister|brother|niece|nephew|grandchild|grandson|granddaughter)",
-        re.IGNORECASE,
-    )
-    pet_tokens = [t.lower() for t in petitioner_name.split() if t]
-    for m in pattern.finditer(text):
+    pet_tokens = frozenset(t.lower() for t in petitioner_name.split() if t)
+    for m in _RELATIONSHIP_LABEL_RE.finditer(text):
         cand = m.group(1).lower()
         window = text[max(0, m.start() - 80) : m.end() + 80].lower()
-        if any(role in window for role in ROLE_BLACKLIST):
+        if _ROLE_RE.search(window):
             continue
         if pet_tokens and not all(tok in window for tok in pet_tokens):
             # prefer matches tied to petitioner; if no petitioner tokens, still allow
@@ -902,86 +1026,102 @@ def _strict_relationship_scan(text: str, petitioner_name: str = "") -> str:
     return ""
 
 
-def _extract_relationship(text: str, pages_text: Optional[List[str]], petitioner_name: str, debug=None) -> str:
-    PRIORITY = [
-        "spouse",
-        "wife",
-        "husband",
-        "domestic partner",
-        "child",
-        "son",
-        "daughter",
-        "parent",
-        "mother",
-        "father",
-        "sibling",
-        "sister",
-        "brother",
-        "grandchild",
-        "niece",
-        "nephew",
-        "cousin",
-        "other",
-        "unknown",
-    ]
+# Relationship ranking (lower is preferred); unknown labels rank after all of these
+_REL_PRIORITY = (
+    "spouse",
+    "wife",
+    "husband",
+    "domestic partner",
+    "child",
+    "son",
+    "daughter",
+    "parent",
+    "mother",
+    "father",
+    "sibling",
+    "sister",
+    "brother",
+    "grandchild",
+    "niece",
+    "nephew",
+    "cousin",
+    "other",
+    "unknown",
+)
+_REL_RANK = {rel: idx for idx, rel in enumerate(_REL_PRIORITY)}
+
+
+def _relationship_rank(rel: str) -> int:
+    return _REL_RANK.get(rel.lower(), len(_REL_PRIORITY))
+
+
+# Relationship values accepted from _extract_relationship without a strict rescan
+_REL_ALLOWED_LC = frozenset(
+    r.lower()
+    for r in REL_ALLOWED
+    + ["spouse", "son", "daughter", "child", "mother", "father", "sister", "brother", "niece", "nephew", "grandchild", "grandson", "granddaughter", "unknown"]
+)
+
+
+_REL_OR_INTEREST_RE = re.compile(r"(?i)relationship|interest")
+_PETITIONER_INTEREST_REL_RE = re.compile(
+    r"interest[s]?\s+of\s+petitioner[s]?.{0,80}?(spouse|wife|husband|child|son|daughter|sister|brother|mother|father|niece|nephew|cousin)",
+    re.IGNORECASE,
+)
 
-    def _rank(rel: str) -> int:
-        rel_low = rel.lower()
-        for idx, val in enumerate(PRIORITY):
-            if rel_low == val:
-                return idx
-        return len(PRIORITY)
 
+def _extract_relationship(text: str, pages_text: Optional[List[str]], petitioner_name: str, debug=None) -> str:
     petitioner_tokens = [t.lower() for t in petitioner_name.split()[:2] if t]
     pages_text = pages_text or []
     last_name = petitioner_name.split()[-1].lower() if petitioner_name else ""
-    table_markers = {
-        "description of legacy",
-        "other interest",
-        "nature of fiduciary status",
-        "legatee",
-        "beneficiary",
-        "all persons and parties so interested",
-        "full residuary legatee",
-        "nominated executor",
-        "successor executor",
-    }
 
     # Step 1: explicit petitioner block on page 1 (source-of-truth)
     if pages_text:
         page1 = pages_text[0]
         pet_block = find_block_after_label(page1, "Petitioner Information", max_lines=20)
         if pet_block:
-            lines = [ln.strip() for ln in pet_block if ln.strip()]
+            lines = _nonempty_stripped(pet_block)
             for idx, line in enumerate(lines):
-                if re.search(r"(?i)relationship|interest", line):
+                if _REL_OR_INTEREST_RE.search(line):
                     rel = _find_relationship_in_lines(lines, idx)
                     if rel:
                         _record(debug, "Relationship", "petitioner_block_pg1", rel, 120)
                         return rel
             block_text = " ".join(pet_block).lower()
-            m = re.search(
-                r"interest[s]?\s+of\s+petitioner[s]?.{0,80}?(spouse|wife|husband|child|son|daughter|sister|brother|mother|father|niece|nephew|cousin)",
-                block_text,
-                re.IGNORECASE,
-            )
+            m = _PETITIONER_INTEREST_REL_RE.search(block_text)
             if m:
                 rel = m.group(1).title()
                 _record(debug, "Relationship", "petitioner_interest_pg1", rel, 115)
                 return rel
 
     candidates: List[Dict[str, str]] = []
+    # (is_table, stripped non-empty lines, lowered lines) computed once per page
+    page_views = []
+    for page in pages_text:
+        lines = _nonempty_stripped(page.splitlines())
+        is_table = bool(_TABLE_MARKER_RE.search(page.lower()))
+        page_views.append((is_table, lines, [ln.lower() for ln in lines]))
+    # Per-page bit vectors, bit i set when line i names a role but no relationship;
+    # built on first use and shared by the proximity scan and last-resort pass.
+    role_masks: Dict[int, int] = {}
+
+    def _role_mask(pg_idx: int) -> int:
+        mask = role_masks.get(pg_idx)
+        if mask is None:
+            mask = 0
+            for idx, low in enumerate(page_views[pg_idx][2]):
+                if _ROLE_RE.search(low) and not _REL_TOKEN_RE.search(low):
+                    mask |= 1 << idx
+            role_masks[pg_idx] = mask
+        return mask
 
     # Step 2: scan pages for petitioner name proximity (avoid tables on later pages)
-    for pg_idx, page in enumerate(pages_text):
-        if pg_idx >= 1 and any(mark in page.lower() for mark in table_markers):
+    for pg_idx, (is_table, lines, lines_low) in enumerate(page_views):
+        if pg_idx >= 1 and is_table:
             continue  # skip beneficiary/distributee tables
-        lines = [ln.strip() for ln in page.splitlines() if ln.strip()]
-        for idx, line in enumerate(lines):
-            low = line.lower()
-            has_role = any(role in low for role in ROLE_BLACKLIST)
-            has_rel = any(tok in low for tok in ["spouse", "husband", "wife", "son", "daughter", "child", "sister", "brother", "mother", "father", "niece", "nephew", "grandchild", "grandson", "granddaughter"])
-            if has_role and not has_rel:
+        role_mask = _role_mask(pg_idx)
+        for idx, low in enumerate(lines_low):
+            if role_mask >> idx & 1:
                 continue
             match_pet = petitioner_tokens and all(tok in low for tok in petitioner_tokens)
             if not match_pet and last_name:
@@ -992,7 +1132,7 @@ def _extract_relationship(text: str, pages_text: Optional[List[str]], petitioner
                     candidates.append(
                         {
                             "rel": rel.title(),
-                            "rank": _rank(rel),
+                            "rank": _relationship_rank(rel),
                             "source": f"page{pg_idx+1}_near_petitioner",
                             "score": 100,
                         }
@@ -1000,35 +1140,38 @@ def _extract_relationship(text: str, pages_text: Optional[List[str]], petitioner
 
     # Step 2b: if still empty, allow table scan to pick relationship for petitioner row only
     if not candidates and pages_text and petitioner_name:
-        for pg_idx, page in enumerate(pages_text):
-            lines = [ln.strip() for ln in page.splitlines() if ln.strip()]
-            for idx, line in enumerate(lines):
-                low = line.lower()
-                if petitioner_name.lower() in low:
+        petitioner_low = petitioner_name.lower()
+        for pg_idx, (_, lines, lines_low) in enumerate(page_views):
+            for idx, low in enumerate(lines_low):
+                if petitioner_low in low:
                     rel = _find_relationship_in_lines(lines, idx)
                     if rel:
-                        candidates.append({"rel": rel.title(), "rank": _rank(rel), "source": f"table_petitioner_pg{pg_idx+1}", "score": 70})
+                        candidates.append({"rel": rel.title(), "rank": _relationship_rank(rel), "source": f"table_petitioner_pg{pg_idx+1}", "score": 70})
                         break
             if candidates:
                 break
 
     # Step 3: generic fallback (non-table pages only)
-    allowed_pages = [p for idx, p in enumerate(pages_text) if not any(mark in p.lower() for mark in table_markers)]
+    allowed_pages = [page for page, (is_table, _, _) in zip(pages_text, page_views) if not is_table]
     if allowed_pages:
         rel_source_text = "\n".join(allowed_pages[:2])
         rel = extract_relationship(rel_source_text)
         if rel:
-            candidates.append({"rel": rel.title(), "rank": _rank(rel), "source": "generic_fallback", "score": 20})
+            candidates.append({"rel": rel.title(), "rank": _relationship_rank(rel), "source": "generic_fallback", "score": 20})
 
     # Step 4: spouse override if petitioner name appears near "spouse"
     if petitioner_name:
-        pet_tokens = [t.lower() for t in petitioner_name.split() if t]
+        pet_tokens = frozenset(t.lower() for t in petitioner_name.split() if t)
         search_text = (text or "").lower()
-        for m in re.finditer(r"spouse", search_text):
-            window = search_text[max(0, m.start() - 80) : m.end() + 80]
-            if pet_tokens and all(tok in window for tok in pet_tokens):
-                candidates.append({"rel": "Spouse", "rank": _rank("Spouse"), "source": "spouse_window_override", "score": 95})
+        # Windows are slices of search_text, so a token missing from the whole
+        # text rules out every window.
+        pos = search_text.find("spouse") if pet_tokens and all(tok in search_text for tok in pet_tokens) else -1
+        while pos != -1:
+            window = search_text[max(0, pos - 80) : pos + 6 + 80]
+            if all(tok in window for tok in pet_tokens):
+                candidates.append({"rel": "Spouse", "rank": _relationship_rank("Spouse"), "source": "spouse_window_override", "score": 95})
                 break
+            pos = search_text.find("spouse", pos + 6)
 
     if not candidates:
         # Last-resort inference across all pages (including tables) using name proximity
@@ -1041,35 +1184,17 @@ def _extract_relationship(text: str, pages_text: Optional[List[str]], petitioner
                 return False
             return (last_token and last_token in line_low) or len(first_token) >= 3
 
-        for page in pages_text:
-            for line in page.splitlines():
-                low = line.lower()
+        for pg_idx, (_, _, lines_low) in enumerate(page_views):
+            role_mask = _role_mask(pg_idx)
+            for idx, low in enumerate(lines_low):
                 if not _match_name(low):
                     continue
-                has_role = any(role in low for role in ROLE_BLACKLIST)
-                has_rel = any(tok in low for tok in ["spouse", "husband", "wife", "son", "daughter", "child", "sister", "brother", "mother", "father", "niece", "nephew", "grandchild", "grandson", "granddaughter"])
-                if has_role and not has_rel:
+                if role_mask >> idx & 1:
                     continue
-                if re.search(r"\b(spouse|husband|wife|widow|widower)\b", low):
-                    candidates.append({"rel": "Spouse", "rank": _rank("Spouse"), "source": "fallback_name_line", "score": 60})
-                    break
-                if re.search(r"\b(son|daughter|child)\b", low):
-                    candidates.append({"rel": "Child", "rank": _rank("Child"), "source": "fallback_name_line", "score": 55})
-                    break
-                if re.search(r"\b(sister|brother)\b", low):
-                    candidates.append({"rel": "Sibling", "rank": _rank("Sibling"), "source": "fallback_name_line", "score": 50})
-                    break
-                if re.search(r"\b(mother|father|parent)\b", low):
-                    candidates.append({"rel": "Parent", "rank": _rank("Parent"), "source": "fallback_name_line", "score": 50})
-                    break
-                if re.search(r"\b(grandchild)\b", low):
-                    candidates.append({"rel": "Grandchild", "rank": _rank("Grandchild"), "source": "fallback_name_line", "score": 45})
-                    break
-                if re.search(r"\b(niece|nephew)\b", low):
-                    candidates.append({"rel": "Niece", "rank": _rank("Niece"), "source": "fallback_name_line", "score": 45})
-                    break
-                if re.search(r"\b(cousin)\b", low):
-                    candidates.append({"rel": "Cousin", "rank": _rank("Cousin"), "source": "fallback_name_line", "score": 40})
+                kinds = {m.lastgroup for m in _REL_LINE_CLASS_RE.finditer(low)}
+                if kinds:
+                    rel_cls, score = next(hit for kind, hit in _REL_LINE_CLASSES if kind in kinds)
+                    candidates.append({"rel": rel_cls, "rank": _relationship_rank(rel_cls), "source": "fallback_name_line", "score": score})
                     break
 
     if not candidates:
@@ -1080,7 +1205,7 @@ def _extract_relationship(text: str, pages_text: Optional[List[str]], petitioner
             cls_line = re.search(r"(?i)child\s+or\s+children.*?(yes|[1-9])", page2)
             if cls_line or ("child or children" in page2_low and "no child" not in page2_low):
                 rel_cls = "Child"
-                candidates.append({"rel": rel_cls, "rank": _rank(rel_cls), "source": "distributee_class_child", "score": 60})
+                candidates.append({"rel": rel_cls, "rank": _relationship_rank(rel_cls), "source": "distributee_class_child", "score": 60})
         if not candidates:
             default_rel = "Unknown"
             _record(debug, "Relationship", "fallback_default", default_rel, 5)
@@ -1093,6 +1218,15 @@ def _extract_relationship(text: str, pages_text: Optional[List[str]], petitioner
     return best["rel"]
 
 
+_VALUE_GOOD_KW = ("gross", "estate", "approximate", "total", "value", "property", "real property", "personal property", "improved")
+_VALUE_BAD_KW = ("filing fee", "receipt", "bond", "cert", "greater than", "less than", "temporary", "fee", "surcharge")
+_PERSONAL_BAD_KW = ("less than", "greater than", "filing fee", "receipt", "bond", "prelim", "cert")
+_VALUE_BAD_RE = re.compile("|".join(map(re.escape, _VALUE_BAD_KW)))
+_PERSONAL_BAD_RE = re.compile("|".join(map(re.escape, _PERSONAL_BAD_KW)))
+# Zero-width lookahead so overlapping keywords ("real property" / "property") all count
+_VALUE_GOOD_RE = re.compile("(?=(" + "|".join(map(re.escape, _VALUE_GOOD_KW)) + "))")
+
+
 def _extract_property_value(pages_text: Optional[List[str]], debug=None) -> str:
     if not pages_text:
         return ""
@@ -1111,27 +1245,23 @@ def _extract_property_value(pages_text: Optional[List[str]], debug=None) -> str:
             return 0.0
 
     # Collect candidates with context scoring
-    good_kw = ["gross", "estate", "approximate", "total", "value", "property", "real property", "personal property", "improved"]
-    bad_kw = ["filing fee", "receipt", "bond", "cert", "greater than", "less than", "temporary", "fee", "surcharge"]
-    candidates: List[tuple[float, int, str]] = []  # (value, score, snippet)
+    # (score, value): plain max() picks highest score, then largest value
+    candidates: List[Tuple[int, float]] = []
 
     for page_idx, page in enumerate(pages_text):
-        for m in re.finditer(r"\$?\s*([0-9]{1,3}(?:,[0-9]{3})+(?:\.\d{2})?)", page):
+        for m in _MONEY_RE.finditer(page):
             val = _parse_money(m.group(1))
             if val == 0:
                 continue
             window_start = max(0, m.start() - 60)
             window_end = min(len(page), m.end() + 60)
             window = page[window_start:window_end].lower()
-            if any(bad in window for bad in bad_kw):
+            if _VALUE_BAD_RE.search(window):
                 continue
-            score = 0
-            for kw in good_kw:
-                if kw in window:
-                    score += 15
+            score = 15 * len(set(_VALUE_GOOD_RE.findall(window)))
             score += min(40, int(val / 100000))  # larger estates score a bit higher
             score += max(0, 10 - page_idx)  # earlier pages slightly higher
-            candidates.append((val, score, window))
+            candidates.append((score, val))
 
     # Previous labeled extraction as backup
     improved = unimproved = personal = 0.0
@@ -1146,7 +1276,6 @@ def _extract_property_value(pages_text: Optional[List[str]], debug=None) -> str:
             m = re.search(r"(?i)unimproved\s+real\s+property[^$]*\$[\s_]*([0-9,\.]+)", joined)
             if m:
                 unimproved = _parse_money(m.group(1))
-        bad_kw = ["less than", "greater than", "filing fee", "receipt", "bond", "prelim", "cert"]
         personal_candidates = []
         primary_matches = []
         for m in re.finditer(r"(?i)personal\s+propert[y]?[^\$]*\$[\s_]*([0-9,\.]+)", joined):
@@ -1159,7 +1288,7 @@ def _extract_property_value(pages_text: Optional[List[str]], debug=None) -> str:
             for m in re.finditer(r"\$[\s_]*([0-9,\.]+)\s+personal\s+propert[y]?", joined, re.IGNORECASE):
                 ctx = joined[max(0, m.start() - 40) : m.end() + 40].lower()
                 val = _parse_money(m.group(1))
-                if val and not any(b in ctx for b in bad_kw):
+                if val and not _PERSONAL_BAD_RE.search(ctx):
                     personal_candidates.append(val)
         if personal_candidates and personal == 0:
             personal = max(personal_candidates)
@@ -1175,18 +1304,19 @@ def _extract_property_value(pages_text: Optional[List[str]], debug=None) -> str:
         ("unimproved_real_property", unimproved, 100),
     ]:
         if val and val > 0:
-            labeled_candidates.append((val, source, score))
+            labeled_candidates.append((val, score, source))
 
     # Use best context-scored candidate first
     if candidates:
-        val, score, _ = max(candidates, key=lambda x: (x[1], x[0]))
+        score, val = max(candidates)
         if val >= 1000:
             value = val
             chosen_source = "context_scored"
             chosen_score = score
 
     if value == 0 and labeled_candidates:
-        val, source, score = max(labeled_candidates, key=lambda x: x[0])
+        # Equal values resolve to the higher-scored (earlier) label, as before
+        val, score, source = max(labeled_candidates)
         value, chosen_source, chosen_score = val, source, score
     elif value == 0:
         priority_candidates = [
@@ -1205,7 +1335,7 @@ def _extract_property_value(pages_text: Optional[List[str]], debug=None) -> str:
     if value and value < 1000:
         bigger_pool = [v for v, _, _ in labeled_candidates if v >= 1000]
         if candidates:
-            bigger_pool.extend([v for v, _, _ in candidates if v >= 1000])
+            bigger_pool.extend([v for _, v in candidates if v >= 1000])
         if bigger_pool:
             value = max(bigger_pool)
             chosen_source = "small_replaced_by_labeled"
@@ -1218,20 +1348,29 @@ def _extract_property_value(pages_text: Optional[List[str]], debug=None) -> str:
     return ""
 
 
+_PHONE_PUNCT = str.maketrans("", "", "()-. \t\n+/")
+
+
+def _digits_only(raw: str) -> str:
+    # Same result as re.sub(r"\D", "", raw) without entering the regex engine:
+    # phone candidates usually only carry separator punctuation, which translate drops in C.
+    digits = raw.translate(_PHONE_PUNCT)
+    if digits.isdecimal() or not digits:
+        return digits
+    return "".join(filter(str.isdecimal, digits))
+
+
 def _extract_phone(text: str, pages_text: Optional[List[str]], debug=None) -> str:
     last_page = pages_text[-1] if pages_text else ""
     page1 = pages_text[0] if pages_text and len(pages_text) >= 1 else ""
     phone = ""
     if last_page:
-        match = re.search(r"(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})", last_page)
+        match = _PHONE_RE.search(last_page)
         if match:
             phone = match.group(1)
             _record(debug, "Phone Number", "last_page_phone", phone, 110)
     if page1:
-        match = re.search(
-            r"(?i)(telephone\s+number|tel(?:ephone)?)[^\d]{0,15}(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})",
-            page1,
-        )
+        match = _TEL_NUMBER_PHONE_RE.search(page1)
         if match:
             phone = match.group(2)
             _record(debug, "Phone Number", "telephone_number_pg1", phone, 100)
@@ -1240,12 +1379,71 @@ def _extract_phone(text: str, pages_text: Optional[List[str]], debug=None) -> st
         if phone:
             _record(debug, "Phone Number", "generic_fallback", phone, 20)
     if phone:
-        digits = re.sub(r"\D", "", phone)
+        digits = _digits_only(phone)
         if len(digits) == 10:
             phone = f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
     return phone
 
 
+def _scan_emails(pattern, text: str):
+    # One pass: the first complete address wins, else the first split one
+    # (TLD separated by OCR whitespace) is kept as a fallback.
+    split_match = None
+    for m in pattern.finditer(text):
+        if m.group("full"):
+            return m, split_match
+        if split_match is None:
+            split_match = m
+    return None, split_match
+
+
+def _attorney_print_name(att_block: str, start: int):
+    # First "print name" after the signature anchor that is followed by a name;
+    # anchored matches instead of a DOTALL .*? sweep over the block.
+    for label in _PRINT_NAME_RE.finditer(att_block, start):
+        m = _NAME_AFTER_LABEL_RE.match(att_block, label.end())
+        if m:
+            return m
+    return None
+
+
+def _attorney_anchor_positions(page: str, page_low: str) -> Tuple[int, int]:
+    # First "Notary Public" and "Signature of Attorney" anchors; the name-capture
+    # regexes only run when their anchor is on the page.
+    if page.isascii():
+        # ASCII lowercasing keeps offsets and matches IGNORECASE exactly, so a
+        # literal find does the job; non-ASCII pages keep the regex scan because
+        # IGNORECASE also folds characters like U+017F into these letters.
+        return page_low.find("notary public"), page_low.find("signature of attorney")
+    notary_pos = sig_pos = -1
+    for m in _ATT_ANCHOR_RE.finditer(page):
+        if m.lastgroup == "notary":
+            if notary_pos == -1:
+                notary_pos = m.start()
+        elif sig_pos == -1:
+            sig_pos = m.start()
+        if notary_pos != -1 and sig_pos != -1:
+            break
+    return notary_pos, sig_pos
+
+
+def _attorney_inference_matches(last_page: str, email: str):
+    # (source, score, match) for the attorney-name inference rules, in priority order.
+    # Lazy, so later anchors are only located when earlier rules produced no name.
+    last_page_low = last_page.lower()
+    if email:
+        email_pos = last_page_low.find(email.lower())
+        if email_pos != -1:
+            yield "inferred_from_email_window", 40, _NAME_CAND_RE.search(last_page, max(0, email_pos - 120), email_pos + 120)
+        else:
+            yield "inferred_from_email_window", 40, _NAME_CAND_RE.search(last_page)
+    notary_pos, sig_pos = _attorney_anchor_positions(last_page, last_page_low)
+    if notary_pos != -1:
+        yield "notary_block_inferred", 32, _NOTARY_NAME_RE.search(last_page)
+    if sig_pos != -1:
+        yield "signature_nearby", 35, _SIGNATURE_NAME_RE.search(last_page, sig_pos + _SIGNATURE_ANCHOR_LEN)
+
+
 def _extract_attorney_info(text: str, pages_text: Optional[List[str]], debug=None) -> (str, str, str):
     last_page = pages_text[-1] if pages_text else ""
     page_idx = len(pages_text) if pages_text else 0
@@ -1260,7 +1458,7 @@ def _extract_attorney_info(text: str, pages_text: Optional[List[str]], debug=Non
             )
 
     def normalize_phone(raw: str) -> str:
-        digits = re.sub(r"\D", "", raw)
+        digits = _digits_only(raw)
         if len(digits) == 10:
             return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
         return raw
@@ -1277,18 +1475,16 @@ def _extract_attorney_info(text: str, pages_text: Optional[List[str]], debug=Non
         low = page.lower()
         if any(anchor in low for anchor in anchors):
             window = page
-            att_name_match = re.search(r"(?i)print name of attorney[^A-Za-z]{0,30}([A-Z .,'-]{3,})", window)
+            att_name_match = _ATT_PRINT_NAME_RE.search(window)
             if att_name_match:
-                cand = _clean_name(re.sub(r"(?i)esq\.?", "", att_name_match.group(1)))
+                cand = _clean_name(_ESQ_RE.sub("", att_name_match.group(1)))
                 add_candidate("attorney_name_candidates", f"page{idx+1}_block", cand, 110)
                 if cand and not is_label_noise(cand) and validate_person_name(cand):
                     attorney = cand
                     _record(debug, "Attorney", f"attorney_block_pg{idx+1}", cand, 120)
-            phone_match = re.search(
-                r"(?i)(telephone|tel)[^\d]{0,15}(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})", window
-            )
+            phone_match = _TEL_PHONE_RE.search(window)
             if not phone_match:
-                phone_match = re.search(r"(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})", window)
+                phone_match = _PHONE_RE.search(window)
             if phone_match:
                 phone_raw = phone_match.group(phone_match.lastindex or 1)
                 phone_norm = normalize_phone(phone_raw)
@@ -1296,18 +1492,12 @@ def _extract_attorney_info(text: str, pages_text: Optional[List[str]], debug=Non
                 if not phone:
                     phone = phone_norm
                     _record(debug, "Phone Number", f"attorney_block_pg{idx+1}", phone_norm, 120)
-            email_match = re.search(r"(?i)([A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})", window, re.IGNORECASE)
-            if not email_match:
-                email_match = re.search(
-                    r"(?i)([A-Z0-9._%+-]+@[A-Z0-9.-]+)\s*\.?\s*(com|net|org|gov|edu|law)",
-                    window,
-                    re.IGNORECASE,
-                )
-            if email_match:
+            email_match, split_match = _scan_emails(_EMAIL_OR_SPLIT_RE, window)
+            if email_match or split_match:
                 email_val = (
-                    email_match.group(0)
-                    if email_match.lastindex == 1
-                    else f"{email_match.group(1)}.{email_match.group(2)}"
+                    email_match.group("full")
+                    if email_match
+                    else f"{split_match.group('local')}.{split_match.group('tld')}"
                 )
                 email_val = email_val.rstrip(" .").lower()
                 add_candidate("attorney_email_candidates", f"page{idx+1}_block", email_val, 120)
@@ -1316,17 +1506,20 @@ def _extract_attorney_info(text: str, pages_text: Optional[List[str]], debug=Non
                     _record(debug, "Email Address", f"attorney_block_pg{idx+1}", email_val, 120)
 
     if last_page:
-        collapsed = re.sub(r"\s+", " ", last_page)
-        att_block_match = re.search(r"(?is)signature of attorney[:\s]*.{0,800}", last_page)
-        att_block = att_block_match.group(0) if att_block_match else last_page
-
-        name_match = re.search(r"(?is)signature of attorney[:\s]*.*?print name[:\s]*([A-Z .,'-]+)", att_block)
+        collapsed = _WS_RE.sub(" ", last_page)
+        att_sig = _ATT_SIGNATURE_RE.search(last_page)
+        if att_sig:
+            att_block = last_page[att_sig.start() : att_sig.end() + 800]
+            name_match = _attorney_print_name(att_block, att_sig.end() - att_sig.start())
+        else:
+            att_block = last_page
+            name_match = None
         if not name_match:
-            name_match = re.search(r"([A-Z .,'-]+?ESQ\.?)", att_block, re.IGNORECASE)
+            name_match = _ESQ_NAME_RE.search(att_block)
         if not name_match:
-            name_match = re.search(r"(?i)print name[:\s]+([A-Z .,'-]{3,})", att_block)
+            name_match = _PRINT_NAME_VALUE_RE.search(att_block)
         if name_match:
-            attorney = _clean_name(re.sub(r"(?i)esq\.?", "", name_match.group(1)))
+            attorney = _clean_name(_ESQ_RE.sub("", name_match.group(1)))
             if attorney:
                 if is_label_noise(attorney) or not validate_person_name(attorney):
                     _record(debug, "Attorney", f"attorney_block_pg{page_idx}", attorney, 0, status="SKIP", reason="label_noise")
@@ -1335,27 +1528,21 @@ def _extract_attorney_info(text: str, pages_text: Optional[List[str]], debug=Non
                     _record(debug, "Attorney", f"attorney_block_pg{page_idx}", attorney, 120)
                 add_candidate("attorney_name_candidates", f"page{page_idx}_block", attorney, 120, status="OK")
 
-        phone_match = re.search(
-            r"(?i)(tel\s*no\.?|telephone)[^\d]{0,15}(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})", att_block
-        )
+        phone_match = _TEL_NO_PHONE_RE.search(att_block)
         if not phone_match:
-            phone_match = re.search(r"(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})", att_block)
+            phone_match = _PHONE_RE.search(att_block)
         if phone_match:
             phone = normalize_phone(phone_match.group(phone_match.lastindex or 1))
             _record(debug, "Phone Number", f"attorney_block_pg{page_idx}", phone, 120)
             add_candidate("attorney_phone_candidates", f"page{page_idx}_block", phone, 120, status="OK")
 
-        email_match = re.search(r"(?i)([A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})", collapsed, re.IGNORECASE)
-        if not email_match:
-            partial_match = re.search(
-                r"(?i)([A-Z0-9._%+-]+@[A-Z0-9.-]+)\s*\.?\s*([A-Z]{2,})", collapsed, re.IGNORECASE
-            )
-            if partial_match:
-                assembled = f"{partial_match.group(1)}.{partial_match.group(2)}"
-                email = assembled.lower()
+        email_match, partial_match = _scan_emails(_EMAIL_OR_PARTIAL_RE, collapsed)
+        if not email_match and partial_match:
+            assembled = f"{partial_match.group('local')}.{partial_match.group('tld')}"
+            email = assembled.lower()
         if email_match:
             if not email:
-                email = email_match.group(1).lower()
+                email = email_match.group("full").lower()
             email = email.rstrip(".")
             email = email.replace("gma.il", "gmail.com")
             _record(debug, "Email Address", f"attorney_block_pg{page_idx}", email, 120)
@@ -1370,32 +1557,18 @@ def _extract_attorney_info(text: str, pages_text: Optional[List[str]], debug=Non
     # If attorney still empty but email/phone exist, try to infer name near contact lines
     if not attorney and pages_text:
         last_page = pages_text[-1]
-        if email:
-            email_pos = last_page.lower().find(email.lower())
-            window = last_page[max(0, email_pos - 120) : email_pos + 120] if email_pos != -1 else last_page
-            name_match = re.search(r"([A-Z][A-Za-z .,'-]{3,})", window)
-            if name_match:
-                inferred = _clean_name(name_match.group(1))
-                if inferred and validate_person_name(inferred) and not is_label_noise(inferred):
-                    attorney = inferred
-                    _record(debug, "Attorney", "inferred_from_email_window", attorney, 40)
-        if not attorney:
-            notary_match = re.search(r"([A-Z][A-Za-z .,'-]{3,})\s+Notary Public", last_page, re.IGNORECASE)
-            if notary_match:
-                inferred = _clean_name(notary_match.group(1))
-                if inferred and validate_person_name(inferred) and not is_label_noise(inferred):
-                    attorney = inferred
-                    _record(debug, "Attorney", "notary_block_inferred", attorney, 32)
-        if not attorney:
-            sig_match = re.search(r"Signature of Attorney.*?([A-Z][A-Za-z .,'-]{3,})", last_page, re.IGNORECASE | re.DOTALL)
-            if sig_match:
-                inferred = _clean_name(sig_match.group(1))
-                if inferred and validate_person_name(inferred) and not is_label_noise(inferred):
-                    attorney = inferred
-                    _record(debug, "Attorney", "signature_nearby", attorney, 35)
+        # Rules run in priority order; the first name that validates wins.
+        for source, score, name_match in _attorney_inference_matches(last_page, email):
+            if not name_match:
+                continue
+            inferred = _clean_name(name_match.group(1))
+            if inferred and validate_person_name(inferred) and not is_label_noise(inferred):
+                attorney = inferred
+                _record(debug, "Attorney", source, attorney, score)
+                break
     # Phone robustness: prefer phone near attorney name if available
     def _clean_phone(raw: str) -> str:
-        digits = re.sub(r"\D", "", raw)
+        digits = _digits_only(raw)
         if len(digits) == 11 and digits.startswith("1"):
             digits = digits[1:]
         if len(digits) != 10:
@@ -1403,18 +1576,19 @@ def _extract_attorney_info(text: str, pages_text: Optional[List[str]], debug=Non
         return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
 
     if attorney and pages_text:
-        joined = " ".join(pages_text)
-        name_pos = joined.lower().find(attorney.lower())
+        joined = _joined_pages(tuple(pages_text))
+        # Case-insensitive literal search; no lowercase copy of the whole document
+        name_match = re.search(re.escape(attorney), joined, re.IGNORECASE)
+        name_pos = name_match.start() if name_match else -1
+        # Window after the name first, then the whole document; the cheap bounded
+        # search usually settles it before the full scan is needed.
+        bounds = ((name_pos, name_pos + 400), (0, len(joined))) if name_pos != -1 else ((0, len(joined)),)
         best_phone = ""
-        if name_pos != -1:
-            window = joined[name_pos:name_pos + 400]
-            m_phone = re.search(r"(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})", window)
-            if m_phone:
-                best_phone = _clean_phone(m_phone.group(1))
-        if not best_phone:
-            m_phone = re.search(r"(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})", joined)
-            if m_phone:
-                best_phone = _clean_phone(m_phone.group(1))
+        for start, end in bounds:
+            m_phone = _PHONE_RE.search(joined, start, end)
+            best_phone = _clean_phone(m_phone.group(1)) if m_phone else ""
+            if best_phone:
+                break
         if best_phone:
             phone = best_phone
 
@@ -1428,13 +1602,27 @@ def _extract_attorney_info(text: str, pages_text: Optional[List[str]], debug=Non
             if email_found:
                 email = email_found
                 _record(debug, "Email Address", "email_pages_scan", email, 90)
-        if phone:
-            phone = correct_ny_phone(phone, pages_text or [], debug=debug)
-        else:
-            phone = correct_ny_phone(_extract_phone(text, pages_text, debug), pages_text or [], debug=debug)
+        if not phone:
+            phone = _extract_phone(text, pages_text, debug)
+        phone = correct_ny_phone(phone, pages_text or [], debug=debug)
     return attorney, phone, email
 
 
+def _label_patterns(*patterns: str) -> Tuple["re.Pattern[str]", ...]:
+    return tuple(re.compile(pat, re.IGNORECASE) for pat in patterns)
+
+
+# Anchor labels for the missing-field fallbacks in extract_form_a
+_DECEASED_LABELS = _label_patterns(r"decedent", r"deceased", r"deceased information")
+_PETITIONER_LABELS = _label_patterns(r"petitioner", r"petitioner\(s\)", r"co-petitioner", r"petitioner information")
+_PETITIONER_ADDRESS_LABELS = _label_patterns(
+    r"petitioner address", r"mailing address", r"residence address", r"address of petitioner"
+)
+_DECEASED_ADDRESS_LABELS = _label_patterns(
+    r"domicile address", r"domicile", r"residence", r"address of decedent", r"property address"
+)
+
+
 def extract_form_a(text: str, pages_text: Optional[List[str]] = None, debug=None) -> Dict[str, str]:
     fields: Dict[str, str] = empty_fields()
     attorney, att_phone, att_email = _extract_attorney_info(text, pages_text, debug)
@@ -1456,7 +1644,7 @@ def extract_form_a(text: str, pages_text: Optional[List[str]] = None, debug=None
             _record(debug, "Deceased Property Address", "strict_scan", strict_addr, 30)
     rel = _extract_relationship(text, pages_text, fields["Petitioner Name"], debug)
     # If relationship is missing or looks like a role/invalid, run strict scan then fallback to UNKNOWN
-    if not rel or rel.lower() not in [r.lower() for r in REL_ALLOWED + ["spouse", "son", "daughter", "child", "mother", "father", "sister", "brother", "niece", "nephew", "grandchild", "grandson", "granddaughter", "unknown"]]:
+    if not rel or rel.lower() not in _REL_ALLOWED_LC:
         strict_rel = _strict_relationship_scan(text, fields["Petitioner Name"])
         if strict_rel:
             rel = strict_rel
@@ -1467,11 +1655,18 @@ def extract_form_a(text: str, pages_text: Optional[List[str]] = None, debug=None
     fields["Relationship"] = rel
     fields["Property Value"] = _extract_property_value(pages_text, debug)
     fields["Attorney"] = attorney
+    # _extract_phone always runs: its candidates belong in the debug trail even when
+    # the attorney block already supplied the number.
     phone_primary = _extract_phone(text, pages_text, debug)
-    email_primary = extract_email(text)
     fields["Phone Number"] = att_phone or phone_primary
-    fields["Email Address"] = att_email or (email_primary.lower() if email_primary else "")
-    if not fields["Email Address"] and pages_text:
+    if att_email:
+        fields["Email Address"] = att_email
+    else:
+        email_primary = extract_email(text)
+        fields["Email Address"] = email_primary.lower() if email_primary else ""
+    # With an attorney found, _extract_attorney_info already ran this same page scan
+    # (and came back empty if att_email is blank), so only rescan without one.
+    if not fields["Email Address"] and pages_text and not attorney:
         email_found = find_emails_in_pages(
             pages_text,
             prefer_near=["signature of attorney", "email (optional)", "print name of attorney", "firm name", "telephone"],
@@ -1479,73 +1674,74 @@ def extract_form_a(text: str, pages_text: Optional[List[str]] = None, debug=None
         )
         fields["Email Address"] = email_found or ""
 
+    # Primary extractors filled everything: skip the anchor-scan fallbacks entirely
+    if all(fields.values()):
+        return fields
+
     # Targeted fallbacks for missing fields using anchor-based parsing (without loosening property value rule).
-    missing = [k for k, v in fields.items() if not v]
-    if missing:
-        lines = split_lines(text)
-        if "Deceased Name" in missing and not fields["Deceased Name"]:
-            deceased_windows = window_after_labels(
-                lines, [r"decedent", r"deceased", r"deceased information"], max_lines=2
-            )
-            deceased_candidates = [ln for ln in (w.split("\n")[0] for w in deceased_windows) if ln]
-            for cand in deceased_candidates:
-                cleaned = _clean_name(cand)
-                if is_label_noise(cleaned):
-                    _record(debug, "Deceased Name", "fallback_anchor", cleaned, 0, status="SKIP", reason="label_noise")
-                    continue
-                if validate_person_name(cleaned) and plausible_name(cleaned):
-                    fields["Deceased Name"] = cleaned
-                    _record(debug, "Deceased Name", "fallback_anchor", cleaned, 15)
-                    break
-        if "Petitioner Name" in missing and not fields["Petitioner Name"]:
-            petitioner_windows = window_after_labels(
-                lines, [r"petitioner", r"petitioner\(s\)", r"co-petitioner", r"petitioner information"], max_lines=2
-            )
-            petitioner_candidates = [ln for ln in (w.split("\n")[0] for w in petitioner_windows) if ln]
-            alt = best_from_candidates(petitioner_candidates, _clean_name, plausible_name)
-            if alt:
-                fields["Petitioner Name"] = alt
-                _record(debug, "Petitioner Name", "fallback_anchor", alt, 15)
-        if "Petitioner Address" in missing and not fields["Petitioner Address"]:
-            pet_addr_candidates: List[str] = []
-            for snippet in window_after_labels(
-                lines,
-                [r"petitioner address", r"mailing address", r"residence address", r"address of petitioner"],
-                max_lines=4,
-            ):
-                pet_addr_candidates.extend(find_addresses(snippet))
-            near_pet = find_address_near_keywords(text, ["petitioner", "mailing address", "petitioner address"])
-            if near_pet:
-                pet_addr_candidates.append(near_pet)
-            best = _clean_text(pick_best_address(pet_addr_candidates))
-            if best:
-                fields["Petitioner Address"] = best
-                _record(debug, "Petitioner Address", "fallback_anchor", best, 15)
-        if "Deceased Property Address" in missing and not fields["Deceased Property Address"]:
-            dec_addr_candidates: List[str] = []
-            for snippet in window_after_labels(
-                lines,
-                [r"domicile address", r"domicile", r"residence", r"address of decedent", r"property address"],
-                max_lines=4,
-            ):
-                dec_addr_candidates.extend(find_addresses(snippet))
-            near_dom = find_address_near_keywords(text, ["domicile", "residence", "property address", "decedent"])
-            if near_dom:
-                dec_addr_candidates.append(near_dom)
-            best = _clean_text(pick_best_address(dec_addr_candidates))
-            if best:
-                fields["Deceased Property Address"] = best
-                _record(debug, "Deceased Property Address", "fallback_anchor", best, 15)
-        if fields["Attorney"]:
-            if "Phone Number" in missing and not fields["Phone Number"]:
-                phone = extract_phone(text)
-                if phone:
-                    fields["Phone Number"] = phone
-                    _record(debug, "Phone Number", "fallback_generic", phone, 10)
-            if "Email Address" in missing and not fields["Email Address"]:
-                email = extract_email(text)
-                if email:
-                    fields["Email Address"] = email
-                    _record(debug, "Email Address", "fallback_generic", email, 5)
+    lines = split_lines(text)
+    if not fields["Deceased Name"]:
+        deceased_windows = window_after_labels(lines, _DECEASED_LABELS, max_lines=2)
+        # first line of each window, split lazily since the loop usually stops early
+        deceased_candidates = (ln for ln in (w.split("\n", 1)[0] for w in deceased_windows) if ln)
+        for cand in deceased_candidates:
+            cleaned = _clean_name(cand)
+            if is_label_noise(cleaned):
+                _record(debug, "Deceased Name", "fallback_anchor", cleaned, 0, status="SKIP", reason="label_noise")
+                continue
+            if validate_person_name(cleaned) and plausible_name(cleaned):
+                fields["Deceased Name"] = cleaned
+                _record(debug, "Deceased Name", "fallback_anchor", cleaned, 15)
+                break
+    if not fields["Petitioner Name"]:
+        petitioner_windows = window_after_labels(lines, _PETITIONER_LABELS, max_lines=2)
+        petitioner_candidates = (ln for ln in (w.split("\n", 1)[0] for w in petitioner_windows) if ln)
+        alt = best_from_candidates(petitioner_candidates, _clean_name, plausible_name)
+        if alt:
+            fields["Petitioner Name"] = alt
+            _record(debug, "Petitioner Name", "fallback_anchor", alt, 15)
+    # Both address fallbacks share one labeled pass over the lines
+    address_labels = {}
+    if not fields["Petitioner Address"]:
+        address_labels["pet"] = _PETITIONER_ADDRESS_LABELS
+    if not fields["Deceased Property Address"]:
+        address_labels["dec"] = _DECEASED_ADDRESS_LABELS
+    address_windows: Dict[str, List[str]] = {"pet": [], "dec": []}
+    if address_labels:
+        for kind, snippet in window_after_labels_multi(lines, address_labels, max_lines=4):
+            address_windows[kind].append(snippet)
+    if not fields["Petitioner Address"]:
+        pet_addr_candidates: List[str] = []
+        for snippet in address_windows["pet"]:
+            pet_addr_candidates.extend(find_addresses(snippet))
+        near_pet = find_address_near_keywords(text, ["petitioner", "mailing address", "petitioner address"])
+        if near_pet:
+            pet_addr_candidates.append(near_pet)
+        best = _clean_text(pick_best_address(pet_addr_candidates))
+        if best:
+            fields["Petitioner Address"] = best
+            _record(debug, "Petitioner Address", "fallback_anchor", best, 15)
+    if not fields["Deceased Property Address"]:
+        dec_addr_candidates: List[str] = []
+        for snippet in address_windows["dec"]:
+            dec_addr_candidates.extend(find_addresses(snippet))
+        near_dom = find_address_near_keywords(text, ["domicile", "residence", "property address", "decedent"])
+        if near_dom:
+            dec_addr_candidates.append(near_dom)
+        best = _clean_text(pick_best_address(dec_addr_candidates))
+        if best:
+            fields["Deceased Property Address"] = best
+            _record(debug, "Deceased Property Address", "fallback_anchor", best, 15)
+    if fields["Attorney"]:
+        if not fields["Phone Number"]:
+            phone = extract_phone(text)
+            if phone:
+                fields["Phone Number"] = phone
+                _record(debug, "Phone Number", "fallback_generic", phone, 10)
+        if not fields["Email Address"]:
+            email = extract_email(text)
+            if email:
+                fields["Email Address"] = email
+                _record(debug, "Email Address", "fallback_generic", email, 5)
 
     return fields
@@ -1,5 +1,7 @@
 import re
-from typing import Dict, List, Optional
+import string
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from extractor_base import (
     empty_fields,
@@ -15,6 +17,104 @@ from extractor_base import (
     REL_ALLOWED,
 )
 
+_WS_RE = re.compile(r"\s+")
+_UNITED_STATES_RE = re.compile(r"(?i)united states")
+_AKA_RE = re.compile(r"(?i)(a/k/a|aka|also known as)")
+_NON_NAME_CHARS_RE = re.compile(r"[^A-Za-z .'-]")
+# ASCII fast path for _NON_NAME_CHARS_RE.
+_NAME_KEEP = frozenset(string.ascii_letters + " .'-")
+_NAME_TRANS = str.maketrans({chr(i): " " for i in range(128) if chr(i) not in _NAME_KEEP})
+_DIGIT_RE = re.compile(r"\d")
+_PHONE_SEPARATORS = str.maketrans("", "", "()-. \t\n\r\f\v")
+_LEADING_DIGIT_RE = re.compile(r"\s*\d")
+_ZIP5_WORD_RE = re.compile(r"\b(\d{5})\b")
+_COMMA_DOLLAR_RE = re.compile(r"[,$]")
+
+# NY|NJ|...|Georgia|Illinois grouped by first letter; branch order within each group is unchanged.
+_STATE_ALT = (
+    "N(?:Y|J|ew York|ew Jersey)|F(?:L|lorida)|C(?:A|T|alifornia|onnecticut)|P(?:A|ennsylvania)"
+    "|T(?:X|exas)|G(?:A|eorgia)|I(?:L|llinois)"
+)
+_STATE_ZIP_RE = re.compile(rf"({_STATE_ALT})\s+(\d{{5}}(?:-\d{{4}})?)", re.IGNORECASE)
+_STATE_ZIP5_RE = re.compile(rf"({_STATE_ALT})\s+(\d{{5}})", re.IGNORECASE)
+# Any match inside a run of city characters implies one at the run's start, so the
+# lookbehind only skips attempts that would re-backtrack the same run.
+_CITY_STATE_ZIP_RE = re.compile(rf"(?<![A-Za-z .'-])([A-Za-z .'-]+),?\s*({_STATE_ALT})\s+(\d{{5}}(?:-\d{{4}})?)", re.IGNORECASE)
+_INLINE_CITY_STATE_ZIP_RE = re.compile(rf"(?<![A-Za-z .'-])([A-Za-z .'-]+)\s+({_STATE_ALT})\s+(\d{{5}}(?:-\d{{4}})?)", re.IGNORECASE)
+# Plain substring tests on lowered lines, one C-level scan per line.
+_STREET_KEYWORD_RE = re.compile(r"road|rd|street|st |ave|avenue|blvd|ln|lane|court|dr")
+_CITY_EXCLUDE_RE = re.compile(r"county|state|zip|country|name|citizenship|date of death|place of death")
+_STATE_MAP = {
+    "new york": "NY",
+    "ny": "NY",
+    "new jersey": "NJ",
+    "nj": "NJ",
+    "florida": "FL",
+    "fl": "FL",
+    "california": "CA",
+    "ca": "CA",
+    "connecticut": "CT",
+    "ct": "CT",
+    "pennsylvania": "PA",
+    "pa": "PA",
+    "texas": "TX",
+    "tx": "TX",
+    "georgia": "GA",
+    "ga": "GA",
+    "illinois": "IL",
+    "il": "IL",
+}
+_CITY_LABEL_WORD_RE = re.compile(r"(?i)city|village|town")
+_STATEN_ISLAND_RE = re.compile(r"(?i)staten\s+island")
+# These two have always been written with escaped backslashes; kept byte-for-byte.
+_STATEN_ISLAND_ESCAPED_RE = re.compile(r"(?i)staten\\s+island")
+_NY_ESCAPED_RE = re.compile(r"(?i)\\bny\\b|new york")
+
+_SECTION1_RE = re.compile(r"(?is)1\..*?(?=2\.)")
+_SECTION2_RE = re.compile(r"(?is)2\..{0,500}")
+_SECTION2_START_RE = re.compile(r"(?is)2\.")
+_ADMIN_ESTATE_OF_RE = re.compile(r"(?is)administration proceeding.*?estate of\s+([A-Z .'-]+?)(?:\s+administration|$)")
+_DECEDENT_INFO_NAME_RE = re.compile(r"(?is)decedent information:.*?name\s+([A-Z .'-]+)")
+_ESTATE_OF_RE = re.compile(r"(?is)estate of\s+([A-Z .'-]+)")
+_NAME_VALUE_RE = re.compile(r"(?i)name[:\s]+([A-Z .'-]+)")
+_NAME_LABEL_RE = re.compile(r"(?i)name[:\s]+")
+_PETITIONER_INFO_NAME_RE = re.compile(r"(?is)petitioner information.*?name[:\s]+([A-Z .'-]+)")
+_PETITIONER_NAME_RE = re.compile(r"(?is)petitioner[^\n]{0,120}?name[:\s]+([A-Z .'-]+)")
+
+_INTEREST_RELATIONSHIP_RE = re.compile(
+    r"(?is)interest of petitioner.*?distributee of decedent.*?relationship[^A-Za-z]{0,10}([A-Za-z ]+)"
+)
+# Listed in priority order; each option is its own group so lastindex gives its rank.
+_REL_OPTIONS = ("Spouse", "Husband", "Wife", "Son", "Daughter", "Child", "Brother", "Sister", "Father", "Mother")
+_REL_OPT_RE = re.compile(r"(?i)\b(?:" + "|".join(f"({opt})" for opt in _REL_OPTIONS) + r")\b")
+_RELATIONSHIP_LABEL_RE = re.compile(
+    r"relationship[^A-Za-z]{0,20}(spouse|husband|wife|son|daughter|child|mother|father|sister|brother|niece|nephew|grandchild|grandson|granddaughter)",
+    re.IGNORECASE,
+)
+
+_MY_DOMICILE_RE = re.compile(r"(?i)my domicile is[:\s]+([A-Z0-9 .,'/-]+)")
+_DOMICILE_LINES_RE = re.compile(r"(?is)domicile:\s*([^\n]+)\n([^\n]+)?\n([^\n]+)?")
+_DOMICILE_COLON_RE = re.compile(r"(?i)domicile\s*:")
+_DOMICILE_LABEL_RE = re.compile(r"(?i)domicile[:\s]+")
+
+_PROPERTY_BAD_KEYWORDS = ("filing fee", "receipt", "bond", "greater than", "less than", "prelim", "cert", "certificate", "surcharge", "fee cap")
+_PROPERTY_GOOD_KEYWORDS = ("gross", "estate", "total", "approximate", "property", "real property", "approximate value", "assets")
+# The leading lookaheads only admit positions a match can start at: a cheap
+# first-character test, then "$, spaces, digit" before the amount alternation runs.
+_MONEY_RE = re.compile(r"(?=[$\s0-9])(?=\$?\s*[0-9])\$?\s*([0-9]{1,3}(?:,[0-9]{3})+(?:\.\d{2})?|[1-9]\d{3,7}(?:\.\d{2})?)")
+_IMPROVED_RE = re.compile(r"(?i)improved[^$\d]{0,40}\$?\s*([0-9,]+(?:\.\d{2})?)")
+_UNIMPROVED_RE = re.compile(r"(?i)unimproved[^$\d]{0,40}\$?\s*([0-9,]+(?:\.\d{2})?)")
+_PERSONAL_RE = re.compile(r"(?i)personal\s+property[^$\d]{0,40}\$?\s*([0-9,]+(?:\.\d{2})?)")
+# IGNORECASE folds these into s/i, and lower() turns U+0130 into two characters,
+# so pages containing them cannot be anchored on the lowered text.
+_FOLD_MISMATCH_CHARS = "\u017f\u0131\u0130"
+
+_PRINT_NAME_OF_ATTORNEY_RE = re.compile(r"(?i)Print Name of Attorney\s*([A-Z .,'/|-]+)")
+_ESQ_WORD_RE = re.compile(r"(?i)esq")
+_ESQ_RE = re.compile(r"(?i)esq\.?")
+_PHONE_RE = re.compile(r"(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})")
+_EMAIL_RE = re.compile(r"(?i)([A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})", re.IGNORECASE)
+
 
 def _record(debug, field: str, source: str, value: str, score: int, status: str = "OK", reason: str = ""):
     if debug is None:
@@ -22,13 +122,31 @@ def _record(debug, field: str, source: str, value: str, score: int, status: str
     debug.setdefault(field, []).append({"source": source, "value": value or "", "score": score, "status": status, "reason": reason})
 
 
+@lru_cache(maxsize=32)
+def _literal_anchor_safe(page: str) -> bool:
+    return page.isascii() or not any(ch in page for ch in _FOLD_MISMATCH_CHARS)
+
+
+def _search_from_literal(pattern, page: str, page_lower: str, literal: str, pos: int = 0, endpos: Optional[int] = None):
+    """pattern.search(page, pos, endpos) for a case-insensitive pattern that starts with ``literal``."""
+    if endpos is None:
+        endpos = len(page)
+    if not _literal_anchor_safe(page):
+        return pattern.search(page, pos, endpos)
+    # The first match sits at one of the literal's offsets in the lowered page.
+    start = page_lower.find(literal, pos, endpos)
+    while start != -1:
+        m = pattern.match(page, start, endpos)
+        if m:
+            return m
+        start = page_lower.find(literal, start + 1, endpos)
+    return None
+
+
 def _clean_text(val: str) -> str:
     if not val:
         return ""
-    val = val.replace("_", " ")
-    val = val.replace(" ,", ",")
-    val = re.sub(r"\s+,", ",", val)
-    val = re.sub(r"\s+", " ", val)
+    val = _WS_RE.sub(" ", val.replace("_", " ")).replace(" ,", ",")
     return val.strip(" ;,:.")
 
 
@@ -36,14 +154,13 @@ def _clean_name(raw: str) -> str:
     if not raw:
         return ""
     raw = raw.replace("_", " ")
-    raw = re.sub(r"(?i)united states", " ", raw)
+    raw = _UNITED_STATES_RE.sub(" ", raw)
     cut = raw
-    aka = re.search(r"(?i)(a/k/a|aka|also known as)", cut)
+    aka = _AKA_RE.search(cut)
     if aka:
         cut = cut[: aka.start()]
-    cut = re.sub(r"[()\[\]]", " ", cut)
-    cut = re.sub(r"[^A-Za-z .'-]", " ", cut)
-    parts = [p for p in re.split(r"\s+", cut) if p]
+    cut = cut.translate(_NAME_TRANS) if cut.isascii() else _NON_NAME_CHARS_RE.sub(" ", cut)
+    parts = [p for p in _WS_RE.split(cut) if p]
     if len(parts) < 2:
         return ""
     cleaned = " ".join(p.title() for p in parts if p.lower() not in {"jr", "sr"})
@@ -53,28 +170,7 @@ def _clean_name(raw: str) -> str:
 def _normalize_state_value(val: str) -> str:
     if not val:
         return ""
-    key = val.replace(".", "").strip().lower()
-    mapping = {
-        "new york": "NY",
-        "ny": "NY",
-        "new jersey": "NJ",
-        "nj": "NJ",
-        "florida": "FL",
-        "fl": "FL",
-        "california": "CA",
-        "ca": "CA",
-        "connecticut": "CT",
-        "ct": "CT",
-        "pennsylvania": "PA",
-        "pa": "PA",
-        "texas": "TX",
-        "tx": "TX",
-        "georgia": "GA",
-        "ga": "GA",
-        "illinois": "IL",
-        "il": "IL",
-    }
-    return mapping.get(key, val.upper())
+    return _STATE_MAP.get(val.replace(".", "").strip().lower(), val.upper())
 
 
 def _assemble_address(street: str, city: str, state: str, zip_code: str = "") -> str:
@@ -84,10 +180,13 @@ def _assemble_address(street: str, city: str, state: str, zip_code: str = "") ->
     zip_code = zip_code.strip()
     if zip_code and city.endswith(zip_code):
         city = city[: -len(zip_code)].strip(" ,")
-    for token in ("united states",):
-        street = re.sub(token, "", street, flags=re.IGNORECASE).strip()
-        city = re.sub(token, "", city, flags=re.IGNORECASE).strip()
-        state = re.sub(token, "", state, flags=re.IGNORECASE).strip()
+    combined = street + city + state
+    # IGNORECASE folds a few non-ASCII letters into "united states", so only ASCII
+    # input can skip the substitutions on a plain substring test.
+    if not combined.isascii() or "united states" in combined.lower():
+        street = _UNITED_STATES_RE.sub("", street).strip()
+        city = _UNITED_STATES_RE.sub("", city).strip()
+        state = _UNITED_STATES_RE.sub("", state).strip()
     parts = []
     if street:
         parts.append(street)
@@ -97,62 +196,58 @@ def _assemble_address(street: str, city: str, state: str, zip_code: str = "") ->
     out = ", ".join(parts)
     if out and zip_code:
         out = f"{out} {zip_code}"
-    out = re.sub(r"\s+", " ", out).strip(" ,")
+    out = " ".join(out.split()).strip(" ,")
     return out
 
 
-def _address_from_label(page: str, label: str) -> str:
-    lines = [ln.strip() for ln in page.splitlines() if ln.strip()]
-    state_zip_re = re.compile(r"(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5}(?:-\d{4})?)", re.IGNORECASE)
-    for idx, line in enumerate(lines):
-        if label.lower() in line.lower():
+def _address_from_label(page: str, page_lower: str, label: str) -> str:
+    label_low = label.lower()
+    if label_low not in page_lower:
+        return ""
+    # lower() never adds or removes line breaks or whitespace, so the lowered page
+    # splits into the same lines.
+    lines: List[str] = []
+    lowered: List[str] = []
+    for ln, ln_low in zip(page.splitlines(), page_lower.splitlines()):
+        ln = ln.strip()
+        if ln:
+            lines.append(ln)
+            lowered.append(ln_low.strip())
+    for idx, line_low in enumerate(lowered):
+        if label_low in line_low:
             street = city = state = zip_code = ""
             section = lines[idx + 1 : idx + 12]
-            # find street line (with digits and comma or road keywords)
-            for candidate in section:
-                low = candidate.lower()
-                if re.search(r"\d", candidate) and ("," in candidate or any(kw in low for kw in ["road", "rd", "street", "st ", "ave", "avenue", "blvd", "ln", "lane", "court", "dr"])):
-                    street = candidate
-                    break
-            # find city line after street
-            if street and street in section:
-                start = section.index(street) + 1
-            else:
-                start = 0
-            for candidate in section[start:]:
-                low = candidate.lower()
-                if re.search(r"\d", candidate):
+            # One walk classifies the lines: the street (digits plus a comma or road
+            # keyword), the first plain city line after it, and the first plain line
+            # overall as the fallback when nothing follows the street.
+            street_found = has_staten = False
+            first_city = city_after_street = ""
+            for candidate, low in zip(section, lowered[idx + 1 : idx + 12]):
+                if _DIGIT_RE.search(candidate):
+                    if not street_found and ("," in candidate or _STREET_KEYWORD_RE.search(low)):
+                        street = candidate
+                        street_found = True
                     continue
-                if any(k in low for k in ["county", "state", "zip", "country", "name", "citizenship", "date of death", "place of death"]):
+                if candidate.upper() == "STATEN ISLAND":
+                    has_staten = True
+                if _CITY_EXCLUDE_RE.search(low):
                     continue
-                city = candidate
-                break
-            if not city:
-                for candidate in section:
-                    low = candidate.lower()
-                    if re.search(r"\d", candidate):
-                        continue
-                    if any(k in low for k in ["county", "state", "zip", "country", "name", "citizenship", "date of death", "place of death"]):
-                        continue
-                    city = candidate
-                    break
-            if not city:
-                for candidate in section:
-                    if candidate.strip().upper() == "STATEN ISLAND":
-                        city = "Staten Island"
-                        break
-            if city and re.search(r"(?i)city|village|town", city):
-                for candidate in section:
-                    if candidate.strip().upper() == "STATEN ISLAND":
-                        city = "Staten Island"
+                if not first_city:
+                    first_city = candidate
+                if street_found and not city_after_street:
+                    city_after_street = candidate
+                    # Later lines only matter for the Staten Island override.
+                    if not _CITY_LABEL_WORD_RE.search(candidate):
                         break
-            # find state+zip line
-            for candidate in section:
-                m = state_zip_re.search(candidate)
-                if m:
-                    state = m.group(1)
-                    zip_code = m.group(2)
-                    break
+            city = city_after_street or first_city
+            if has_staten and (not city or _CITY_LABEL_WORD_RE.search(city)):
+                city = "Staten Island"
+            # find state+zip line; NUL cannot be part of a match, so one search over the
+            # joined section finds the first matching line's leftmost match
+            m = _STATE_ZIP_RE.search("\0".join(section))
+            if m:
+                state = m.group(1)
+                zip_code = m.group(2)
             if not city and state and zip_code and state.lower() in {"ny", "new york"}:
                 city = "Staten Island"
             addr = _assemble_address(street, city, state, zip_code)
@@ -161,41 +256,46 @@ def _address_from_label(page: str, label: str) -> str:
     return ""
 
 
-def _extract_between(label: str, text: str, window: int = 200) -> str:
-    pos = text.lower().find(label.lower())
+def _extract_between(label: str, text: str, window: int = 200, text_lower: Optional[str] = None) -> str:
+    if text_lower is None:
+        text_lower = text.lower()
+    pos = text_lower.find(label.lower())
     if pos == -1:
         return ""
     snippet = text[pos : pos + window]
     return snippet
 
 
-def _extract_deceased_name(pages_text: List[str], text: str, debug=None) -> str:
+def _extract_deceased_name(pages_text: List[str], text: str, debug=None, pages_lower: Optional[List[str]] = None) -> str:
+    if pages_lower is None:
+        pages_lower = [p.lower() for p in pages_text]
     page1 = pages_text[0] if pages_text else ""
+    page1_lower = pages_lower[0] if pages_lower else ""
     page2 = pages_text[1] if len(pages_text) > 1 else ""
     cand = ""
-    m = re.search(r"(?is)administration proceeding.*?estate of\s+([A-Z .'-]+?)(?:\s+administration|$)", page1)
+    m = _search_from_literal(_ADMIN_ESTATE_OF_RE, page1, page1_lower, "administration proceeding")
     if m:
         cand = _clean_name(m.group(1))
         if cand:
             _record(debug, "Deceased Name", "estate_of_pg1", cand, 100)
             return cand
-    for idx, page in enumerate(pages_text):
-        m = re.search(r"(?is)decedent information:.*?name\s+([A-Z .'-]+)", page)
+    for idx, (page, page_lower) in enumerate(zip(pages_text, pages_lower)):
+        m = _search_from_literal(_DECEDENT_INFO_NAME_RE, page, page_lower, "decedent information:")
         if m:
             cand = _clean_name(m.group(1))
             if cand:
                 _record(debug, "Deceased Name", f"decedent_info_pg{idx+1}", cand, 90)
                 return cand
-    m = re.search(r"(?is)estate of\s+([A-Z .'-]+)", text)
+    m = _ESTATE_OF_RE.search(text)
     if m:
         cand = _clean_name(m.group(1))
         if cand:
             _record(debug, "Deceased Name", "estate_of_text", cand, 80)
             return cand
     # Section 2 block scan
-    sec2_match = re.search(r"(?is)2\..{0,500}", page1)
+    sec2_match = _SECTION2_RE.search(page1)
     if sec2_match:
-        m2 = re.search(r"(?i)name[:\s]+([A-Z .'-]+)", sec2_match.group(0))
+        m2 = _NAME_VALUE_RE.search(sec2_match.group(0))
         if m2:
             cand = _clean_name(m2.group(1))
             if cand:
@@ -204,19 +304,20 @@ def _extract_deceased_name(pages_text: List[str], text: str, debug=None) -> str:
     return _clean_name(cand)
 
 
-def _extract_petitioner_name(pages_text: List[str], debug=None) -> str:
+def _extract_petitioner_name(pages_text: List[str], debug=None, pages_lower: Optional[List[str]] = None) -> str:
     page1 = pages_text[0] if pages_text else ""
-    block_match = re.search(r"(?is)petitioner information.*?name[:\s]+([A-Z .'-]+)", page1)
+    page1_lower = pages_lower[0] if pages_lower else page1.lower()
+    block_match = _search_from_literal(_PETITIONER_INFO_NAME_RE, page1, page1_lower, "petitioner information")
     if block_match:
         name = _clean_name(block_match.group(1))
         if name and "citizenship" not in name.lower():
             _record(debug, "Petitioner Name", "petitioner_block_pg1", name, 110)
             return name
-    sec1_match = re.search(r"(?is)1\..*?(?=2\.)", page1)
+    sec1_match = _SECTION1_RE.search(page1)
     scope = sec1_match.group(0) if sec1_match else page1
-    m = re.search(r"(?is)petitioner[^\n]{0,120}?name[:\s]+([A-Z .'-]+)", scope)
+    m = _PETITIONER_NAME_RE.search(scope)
     if not m:
-        m = re.search(r"(?i)name[:\s]+([A-Z .'-]+)", scope)
+        m = _NAME_VALUE_RE.search(scope)
     if m:
         name = _clean_name(m.group(1))
         if name:
@@ -234,35 +335,39 @@ def _extract_petitioner_name(pages_text: List[str], debug=None) -> str:
                     return name
     for ln in lines:
         if "name:" in ln.lower():
-            name = _clean_name(re.sub(r"(?i)name[:\s]+", "", ln))
+            name = _clean_name(_NAME_LABEL_RE.sub("", ln))
             if name:
                 _record(debug, "Petitioner Name", "petitioner_line_scan", name, 90)
                 return name
     return ""
 
 
-def _extract_relationship(pages_text: List[str], debug=None) -> str:
+def _extract_relationship(pages_text: List[str], debug=None, pages_lower: Optional[List[str]] = None) -> str:
     page1 = pages_text[0] if pages_text else ""
-    sec1_match = re.search(r"(?is)1\..*?(?=2\.)", page1)
+    page1_lower = pages_lower[0] if pages_lower else page1.lower()
+    sec1_match = _SECTION1_RE.search(page1)
     scope = sec1_match.group(0) if sec1_match else page1
-    m = re.search(r"(?is)interest of petitioner.*?distributee of decedent.*?relationship[^A-Za-z]{0,10}([A-Za-z ]+)", scope)
+    scope_start, scope_end = sec1_match.span() if sec1_match else (0, len(page1))
+    m = _search_from_literal(_INTEREST_RELATIONSHIP_RE, page1, page1_lower, "interest of petitioner", scope_start, scope_end)
     if m:
         rel = _clean_text(m.group(1)).title()
         if rel and rel.lower() not in ROLE_BLACKLIST:
             _record(debug, "Relationship", "petitioner_interest_pg1", rel, 100)
             return rel
-    for opt in ["Spouse", "Husband", "Wife", "Son", "Daughter", "Child", "Brother", "Sister", "Father", "Mother"]:
-        if re.search(rf"(?i)\b{opt}\b", scope):
-            rel = opt.title()
-            _record(debug, "Relationship", "petitioner_interest_scan", rel, 80)
-            return rel
+    best_rank = None
+    for opt_match in _REL_OPT_RE.finditer(scope):
+        rank = opt_match.lastindex - 1
+        if best_rank is None or rank < best_rank:
+            best_rank = rank
+            if rank == 0:
+                break
+    if best_rank is not None:
+        rel = _REL_OPTIONS[best_rank].title()
+        _record(debug, "Relationship", "petitioner_interest_scan", rel, 80)
+        return rel
     # strict scan fallback across document
-    pattern = re.compile(
-        r"relationship[^A-Za-z]{0,20}(spouse|husband|wife|son|daughter|child|mother|father|sister|brother|niece|nephew|grandchild|grandson|granddaughter)",
-        re.IGNORECASE,
-    )
     for page in pages_text:
-        for m in pattern.finditer(page):
+        for m in _RELATIONSHIP_LABEL_RE.finditer(page):
             cand = m.group(1).lower()
             if cand in ROLE_BLACKLIST:
                 continue
@@ -272,10 +377,12 @@ def _extract_relationship(pages_text: List[str], debug=None) -> str:
     return "Unknown"
 
 
-def _extract_petitioner_address(pages_text: List[str], debug=None) -> str:
+def _extract_petitioner_address(pages_text: List[str], debug=None, pages_lower: Optional[List[str]] = None) -> str:
+    if pages_lower is None:
+        pages_lower = [p.lower() for p in pages_text]
     # Prefer "My domicile is" statements (signature page)
     for idx, page in enumerate(pages_text):
-        m = re.search(r"(?i)my domicile is[:\s]+([A-Z0-9 .,'/-]+)", page)
+        m = _search_from_literal(_MY_DOMICILE_RE, page, pages_lower[idx], "my domicile is")
         if m:
             addr = _assemble_address(m.group(1), "", "", "")
             addr = clean_address_strict(addr, field="Petitioner Address", debug=debug)
@@ -284,21 +391,17 @@ def _extract_petitioner_address(pages_text: List[str], debug=None) -> str:
                 return addr
     page1 = pages_text[0] if pages_text else ""
     # Direct pattern grab: Domicile line plus following lines for city/state/zip
-    dom_pat = re.search(r"(?is)domicile:\s*([^\n]+)\n([^\n]+)?\n([^\n]+)?", page1)
+    dom_pat = _search_from_literal(_DOMICILE_LINES_RE, page1, pages_lower[0] if pages_lower else "", "domicile:")
     if dom_pat:
         street_line = dom_pat.group(1) or ""
         line2 = dom_pat.group(2) or ""
         line3 = dom_pat.group(3) or ""
         street = street_line
-        city = "Staten Island" if re.search(r"(?i)staten\s+island", street_line) or re.search(r"(?i)staten\s+island", line2) else ""
+        city = "Staten Island" if _STATEN_ISLAND_RE.search(street_line) or _STATEN_ISLAND_RE.search(line2) else ""
         state = ""
         zip_code = ""
         for ln in (line2, line3, street_line):
-            mzip = re.search(
-                r"(NJ|NY|FL|CA|CT|PA|TX|GA|IL|New Jersey|New York|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5})",
-                ln,
-                re.IGNORECASE,
-            )
+            mzip = _STATE_ZIP5_RE.search(ln)
             if mzip:
                 # Avoid capturing phone numbers (more digits immediately after)
                 end = mzip.end(2)
@@ -309,11 +412,7 @@ def _extract_petitioner_address(pages_text: List[str], debug=None) -> str:
                 break
         if not state or not zip_code:
             window = page1[dom_pat.end() : dom_pat.end() + 220]
-            mstatezip = re.search(
-                r"(NJ|NY|FL|CA|CT|PA|TX|GA|IL|New Jersey|New York|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5})",
-                window,
-                re.IGNORECASE,
-            )
+            mstatezip = _STATE_ZIP5_RE.search(window)
             if mstatezip:
                 state = state or _normalize_state_value(mstatezip.group(1))
                 zip_code = zip_code or mstatezip.group(2)
@@ -322,12 +421,12 @@ def _extract_petitioner_address(pages_text: List[str], debug=None) -> str:
         if cleaned_dom:
             _record(debug, "Petitioner Address", "petitioner_domicile_block", cleaned_dom, 120)
             return cleaned_dom
-    block_addr = _address_from_label(page1, "Petitioner Information")
+    block_addr = _address_from_label(page1, pages_lower[0] if pages_lower else "", "Petitioner Information")
     if block_addr:
         block_addr = clean_address_strict(block_addr, field="Petitioner Address", debug=debug)
         _record(debug, "Petitioner Address", "petitioner_block_pg1", block_addr, 110)
         return block_addr
-    sec1_match = re.search(r"(?is)1\..*?(?=2\.)", page1)
+    sec1_match = _SECTION1_RE.search(page1)
     scope = sec1_match.group(0) if sec1_match else page1
     lines = [ln.strip() for ln in scope.splitlines() if ln.strip()]
     street = city = state = zip_code = ""
@@ -337,12 +436,12 @@ def _extract_petitioner_address(pages_text: List[str], debug=None) -> str:
         if low.startswith("domicile"):
             if street:
                 continue  # keep first domicile block (petitioner)
-            if not re.match(r"(?i)domicile\\s*:", line):
+            if not _DOMICILE_COLON_RE.match(line):
                 continue
-            if not re.search(r"\d", line):
+            if not _DIGIT_RE.search(line):
                 continue
-            raw = re.sub(r"(?i)domicile[:\s]+", "", line)
-            if not re.match(r"\s*\d", raw):
+            raw = _DOMICILE_LABEL_RE.sub("", line)
+            if not _LEADING_DIGIT_RE.match(raw):
                 continue
             if "," in raw:
                 parts = [p.strip() for p in raw.split(",", 1)]
@@ -351,23 +450,15 @@ def _extract_petitioner_address(pages_text: List[str], debug=None) -> str:
             else:
                 street = raw or street
             window = " ".join(lines[idx + 1 : idx + 5])
-            combo = re.search(
-                r"([A-Za-z .'-]+),?\s*(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5}(?:-\d{4})?)",
-                window,
-                re.IGNORECASE,
-            )
+            combo = _CITY_STATE_ZIP_RE.search(window)
             if combo:
                 city = city or combo.group(1)
                 state = state or combo.group(2)
                 zip_code = zip_code or combo.group(3)
-        if not street and re.search(r"\d", line) and "," in line:
+        if not street and _DIGIT_RE.search(line) and "," in line:
             street = line
         if not state or not zip_code:
-            inline_combo = re.search(
-                r"([A-Za-z .'-]+)\s+(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5}(?:-\d{4})?)",
-                line,
-                re.IGNORECASE,
-            )
+            inline_combo = _INLINE_CITY_STATE_ZIP_RE.search(line)
             if inline_combo:
                 city = city or inline_combo.group(1)
                 state = state or inline_combo.group(2)
@@ -376,12 +467,12 @@ def _extract_petitioner_address(pages_text: List[str], debug=None) -> str:
     if city and city.lower() == "fanwood":
         state = "NJ" if not state or state.lower() == "ny" else state
     if not zip_code:
-        m_zip = re.search(r"\b(\d{5})\b", scope)
+        m_zip = _ZIP5_WORD_RE.search(scope)
         if m_zip:
             zip_code = m_zip.group(1)
     if city and city.lower() == "fanwood" and zip_code and zip_code.startswith("07"):
         state = "NJ"
-    if not city and re.search(r"(?i)staten\s+island", scope):
+    if not city and _STATEN_ISLAND_RE.search(scope):
         city = "Staten Island"
     # Avoid defaulting petitioner state to NY from court header; rely on block content
     addr = _assemble_address(street, city, state, zip_code)
@@ -400,16 +491,18 @@ def _extract_petitioner_address(pages_text: List[str], debug=None) -> str:
     return ""
 
 
-def _extract_deceased_address(pages_text: List[str], debug=None) -> str:
+def _extract_deceased_address(pages_text: List[str], debug=None, pages_lower: Optional[List[str]] = None) -> str:
+    if pages_lower is None:
+        pages_lower = [p.lower() for p in pages_text]
     # Anchor strictly to Decedent Information section
-    for idx, page in enumerate(pages_text):
-        if "decedent information" in page.lower():
-            addr_block = _address_from_label(page, "Decedent Information")
+    for idx, (page, page_lower) in enumerate(zip(pages_text, pages_lower)):
+        if "decedent information" in page_lower:
+            addr_block = _address_from_label(page, page_lower, "Decedent Information")
             if addr_block:
                 _record(debug, "Deceased Property Address", f"decedent_block_pg{idx+1}", addr_block, 105)
                 return addr_block
     scope_source = "\n".join(pages_text[:2]) if pages_text else ""
-    sec_start = re.search(r"(?is)2\.", scope_source)
+    sec_start = _SECTION2_START_RE.search(scope_source)
     scope = scope_source[sec_start.start() :] if sec_start else scope_source
     lines = [ln.strip() for ln in scope.splitlines() if ln.strip()]
     street = city = state = zip_code = ""
@@ -417,7 +510,7 @@ def _extract_deceased_address(pages_text: List[str], debug=None) -> str:
     for idx, line in enumerate(lines):
         low = line.lower()
         if low.startswith("domicile"):
-            raw = re.sub(r"(?i)domicile[:\s]+", "", line)
+            raw = _DOMICILE_LABEL_RE.sub("", line)
             if "," in raw:
                 parts = [p.strip() for p in raw.split(",", 1)]
                 street = parts[0]
@@ -425,36 +518,24 @@ def _extract_deceased_address(pages_text: List[str], debug=None) -> str:
             else:
                 street = raw or street
             window = " ".join(lines[idx + 1 : idx + 5])
-            combo = re.search(
-                r"([A-Za-z .'-]+),?\s*(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5}(?:-\d{4})?)",
-                window,
-                re.IGNORECASE,
-            )
+            combo = _CITY_STATE_ZIP_RE.search(window)
             if combo:
                 city = city or combo.group(1)
                 state = state or combo.group(2)
                 zip_code = zip_code or combo.group(3)
-            state_zip = re.search(
-                r"(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5}(?:-\d{4})?)",
-                window,
-                re.IGNORECASE,
-            )
+            state_zip = _STATE_ZIP_RE.search(window)
             if state_zip:
                 state = state or state_zip.group(1)
                 zip_code = zip_code or state_zip.group(2)
         if not state or not zip_code:
-            inline_combo = re.search(
-                r"([A-Za-z .'-]+)\s+(NY|NJ|FL|CA|CT|PA|TX|GA|IL|New York|New Jersey|Florida|California|Connecticut|Pennsylvania|Texas|Georgia|Illinois)\s+(\d{5}(?:-\d{4})?)",
-                line,
-                re.IGNORECASE,
-            )
+            inline_combo = _INLINE_CITY_STATE_ZIP_RE.search(line)
             if inline_combo:
                 city = city or inline_combo.group(1)
                 state = state or inline_combo.group(2)
                 zip_code = zip_code or inline_combo.group(3)
-    if not city and re.search(r"(?i)staten\\s+island", scope):
+    if not city and _STATEN_ISLAND_ESCAPED_RE.search(scope):
         city = "Staten Island"
-    if not state and re.search(r"(?i)\\bny\\b|new york", scope):
+    if not state and _NY_ESCAPED_RE.search(scope):
         state = "NY"
     addr = _assemble_address(street, city, state, zip_code)
     if addr:
@@ -470,16 +551,31 @@ def _extract_deceased_address(pages_text: List[str], debug=None) -> str:
             return best
     return ""
 
-def _extract_property_value(pages_text: List[str], debug=None) -> str:
+
+def _find_labeled_amounts(page: str, page_lower: str):
+    return (
+        _search_from_literal(_IMPROVED_RE, page, page_lower, "improved"),
+        _search_from_literal(_UNIMPROVED_RE, page, page_lower, "unimproved"),
+        _search_from_literal(_PERSONAL_RE, page, page_lower, "personal"),
+    )
+
+
+def _extract_property_value(pages_text: List[str], debug=None, pages_lower: Optional[List[str]] = None) -> str:
     page2 = pages_text[1] if len(pages_text) > 1 else pages_text[0] if pages_text else ""
-    money_re = re.compile(r"\$?\s*([0-9]{1,3}(?:,[0-9]{3})+(?:\.\d{2})?|[1-9]\d{3,7}(?:\.\d{2})?)")
-    bad_kw = ["filing fee", "receipt", "bond", "greater than", "less than", "prelim", "cert", "certificate", "surcharge", "fee cap"]
-    good_kw = ["gross", "estate", "total", "approximate", "property", "real property", "approximate value", "assets"]
+    if pages_lower is None:
+        pages_lower = [p.lower() for p in pages_text]
+    page2_lower = pages_lower[1] if len(pages_lower) > 1 else pages_lower[0] if pages_lower else ""
+    # Slicing the lowered page matches lowering each slice unless lower() changed the length.
+    window_src = page2_lower if len(page2_lower) == len(page2) else None
     all_amounts: List[float] = []
-    context_candidates: List[tuple[float, int]] = []  # (value, score)
-    for m in money_re.finditer(page2):
-        window = page2[max(0, m.start() - 60) : m.end() + 60].lower()
-        if any(bad in window for bad in bad_kw):
+    context_candidates: List[tuple[int, float]] = []  # (score, value)
+    for m in _MONEY_RE.finditer(page2):
+        start = max(0, m.start() - 60)
+        if window_src is not None:
+            window = window_src[start : m.end() + 60]
+        else:
+            window = page2[start : m.end() + 60].lower()
+        if any(bad in window for bad in _PROPERTY_BAD_KEYWORDS):
             continue
         try:
             amt = float(m.group(1).replace(",", ""))
@@ -488,10 +584,10 @@ def _extract_property_value(pages_text: List[str], debug=None) -> str:
         all_amounts.append(amt)
         if amt >= 1000:
             score = 0
-            for kw in good_kw:
+            for kw in _PROPERTY_GOOD_KEYWORDS:
                 if kw in window:
                     score += 15
-            context_candidates.append((amt, score))
+            context_candidates.append((score, amt))
 
     def to_val(match_obj):
         if not match_obj:
@@ -501,9 +597,7 @@ def _extract_property_value(pages_text: List[str], debug=None) -> str:
         except Exception:  # noqa: BLE001
             return 0.0
 
-    improved = re.search(r"(?i)improved[^$\d]{0,40}\$?\s*([0-9,]+(?:\.\d{2})?)", page2)
-    unimproved = re.search(r"(?i)unimproved[^$\d]{0,40}\$?\s*([0-9,]+(?:\.\d{2})?)", page2)
-    personal = re.search(r"(?i)personal\s+property[^$\d]{0,40}\$?\s*([0-9,]+(?:\.\d{2})?)", page2)
+    improved, unimproved, personal = _find_labeled_amounts(page2, page2_lower)
 
     improved_val = to_val(improved)
     unimproved_val = to_val(unimproved)
@@ -517,7 +611,7 @@ def _extract_property_value(pages_text: List[str], debug=None) -> str:
 
     value = 0.0
     if context_candidates:
-        best_val, best_score = max(context_candidates, key=lambda x: (x[1], x[0]))
+        best_score, best_val = max(context_candidates)
         value = best_val
         _record(debug, "Property Value", "context_scored", f"{value:.2f}", 98)
     if value == 0.0 and labeled_amounts:
@@ -537,7 +631,7 @@ def _extract_property_value(pages_text: List[str], debug=None) -> str:
             _record(debug, "Property Value", "max_amount_scan", f"{value:.2f}", 90)
 
     if chosen_raw:
-        stripped = re.sub(r"[,$]", "", chosen_raw)
+        stripped = _COMMA_DOLLAR_RE.sub("", chosen_raw)
         if stripped.startswith("3") and stripped[1:].startswith("55"):
             try:
                 candidate = float(stripped[1:])
@@ -549,15 +643,14 @@ def _extract_property_value(pages_text: List[str], debug=None) -> str:
 
     # Rule: if improved/unimproved are zero and personal has value, use personal
     if value >= 100000 and all_amounts:
-        smaller = [amt for amt in all_amounts if 1000 <= amt < value and value / amt >= 3]
-        if smaller:
-            best_small = max(smaller)
+        best_small = max((amt for amt in all_amounts if 1000 <= amt < value and value / amt >= 3), default=0.0)
+        if best_small:
             _record(debug, "Property Value", "ocr_inflation_guard", f"{best_small:.2f}", 85)
             value = best_small
 
     # reject small value if larger labeled exists
     if value < 1000 and labeled_amounts:
-        big = max(val for _, val in labeled_amounts if val >= 1000) if any(val >= 1000 for _, val in labeled_amounts) else 0
+        big = max((val for _, val in labeled_amounts if val >= 1000), default=0)
         if big >= 1000:
             value = big
             _record(debug, "Property Value", "small_replaced_by_labeled", f"{value:.2f}", 88)
@@ -572,15 +665,20 @@ def _extract_property_value(pages_text: List[str], debug=None) -> str:
     return ""
 
 
-def _extract_attorney(pages_text: List[str], debug=None) -> str:
+def _attorney_ok(name: str) -> bool:
+    return not is_label_noise(name) and name.lower() not in ROLE_WORDS and validate_person_name(name)
+
+
+def _extract_attorney(pages_text: List[str], debug=None, pages_lower: Optional[List[str]] = None) -> str:
     last = pages_text[-1] if pages_text else ""
-    match = re.search(r"(?i)Print Name of Attorney\s*([A-Z .,'/|-]+)", last)
+    last_lower = pages_lower[-1] if pages_lower else last.lower()
+    match = _search_from_literal(_PRINT_NAME_OF_ATTORNEY_RE, last, last_lower, "print name of attorney")
     if match:
         raw = match.group(1)
-        has_esq = bool(re.search(r"(?i)esq", raw))
+        has_esq = bool(_ESQ_WORD_RE.search(raw))
         name = _clean_name(raw.replace("ESQ", "").replace("ESQ.", "").replace("|", " "))
         if name:
-            if is_label_noise(name) or name.lower() in ROLE_WORDS or not validate_person_name(name):
+            if not _attorney_ok(name):
                 _record(debug, "Attorney", "print_name_of_attorney", name, 0, status="SKIP", reason="label_noise")
             else:
                 if has_esq and not name.lower().endswith("esq"):
@@ -588,11 +686,12 @@ def _extract_attorney(pages_text: List[str], debug=None) -> str:
                 _record(debug, "Attorney", "print_name_of_attorney", name, 100)
                 return name
     # fallback to a standalone line with ESQ
-    for line in last.splitlines():
-        if "ESQ" in line.upper():
-            name = _clean_name(re.sub(r"(?i)esq\.?", "", line))
+    # upper() never creates or removes line breaks, so the two splits stay aligned
+    for line, line_upper in zip(last.splitlines(), last.upper().splitlines()):
+        if "ESQ" in line_upper:
+            name = _clean_name(_ESQ_RE.sub("", line))
             if name:
-                if is_label_noise(name) or name.lower() in ROLE_WORDS or not validate_person_name(name):
+                if not _attorney_ok(name):
                     _record(debug, "Attorney", "esq_line_last_page", name, 0, status="SKIP", reason="label_noise")
                 else:
                     _record(debug, "Attorney", "esq_line_last_page", name, 90)
@@ -604,30 +703,33 @@ def _extract_phone_email(pages_text: List[str], debug=None) -> (str, str):
     last = pages_text[-1] if pages_text else ""
     phone = ""
     email = ""
-    phone_match = re.search(r"(\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4})", last)
+    phone_match = _PHONE_RE.search(last)
     if phone_match:
-        digits = re.sub(r"\D", "", phone_match.group(1))
+        # _PHONE_RE only admits digits, parentheses and one [-\s.] between groups.
+        digits = phone_match.group(1).translate(_PHONE_SEPARATORS)
+        if not digits.isdecimal():
+            digits = "".join(filter(str.isdecimal, digits))
         if len(digits) == 10:
             phone = f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
             _record(debug, "Phone Number", "last_page_phone", phone, 100)
-    email_match = re.search(r"(?i)([A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})", last, re.IGNORECASE)
+    email_match = _EMAIL_RE.search(last)
     if email_match:
         email = email_match.group(1).lower()
         _record(debug, "Email Address", "last_page_email", email, 100)
     return phone, email
 
 
-def extract_form_admin(text: str, pages_text: Optional[List[str]] = None, debug=None) -> Dict[str, str]:
-    pages_text = pages_text or []
+def _extract_form_admin(text: str, pages_text: List[str], debug) -> Dict[str, str]:
+    pages_lower = [p.lower() for p in pages_text]
     fields: Dict[str, str] = empty_fields()
 
-    fields["Deceased Name"] = _extract_deceased_name(pages_text, text, debug)
-    fields["Petitioner Name"] = _extract_petitioner_name(pages_text, debug)
-    fields["Relationship"] = _extract_relationship(pages_text, debug)
-    fields["Deceased Property Address"] = _extract_deceased_address(pages_text, debug)
-    fields["Petitioner Address"] = _extract_petitioner_address(pages_text, debug)
-    fields["Property Value"] = _extract_property_value(pages_text, debug)
-    fields["Attorney"] = _extract_attorney(pages_text, debug)
+    fields["Deceased Name"] = _extract_deceased_name(pages_text, text, debug, pages_lower)
+    fields["Petitioner Name"] = _extract_petitioner_name(pages_text, debug, pages_lower)
+    fields["Relationship"] = _extract_relationship(pages_text, debug, pages_lower)
+    fields["Deceased Property Address"] = _extract_deceased_address(pages_text, debug, pages_lower)
+    fields["Petitioner Address"] = _extract_petitioner_address(pages_text, debug, pages_lower)
+    fields["Property Value"] = _extract_property_value(pages_text, debug, pages_lower)
+    fields["Attorney"] = _extract_attorney(pages_text, debug, pages_lower)
     phone, email = _extract_phone_email(pages_text, debug)
     if not fields["Attorney"]:
         phone = ""
@@ -659,3 +761,20 @@ def extract_form_admin(text: str, pages_text: Optional[List[str]] = None, debug=
             _record(debug, "_warnings", "missing_required", f"{req} missing", 0, status="WARN", reason="required_missing")
 
     return fields
+
+
+@lru_cache(maxsize=32)
+def _extract_form_admin_cached(text: str, pages: Tuple[str, ...]):
+    # Extraction only depends on the text, so re-runs of the same document reuse the
+    # fields and replay the debug records.
+    debug: Dict[str, list] = {}
+    fields = _extract_form_admin(text, list(pages), debug)
+    return tuple(fields.items()), tuple((key, tuple(entries)) for key, entries in debug.items())
+
+
+def extract_form_admin(text: str, pages_text: Optional[List[str]] = None, debug=None) -> Dict[str, str]:
+    fields, records = _extract_form_admin_cached(text, tuple(pages_text or ()))
+    if debug is not None:
+        for key, entries in records:
+            debug.setdefault(key, []).extend(entries)
+    return dict(fields)
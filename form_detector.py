@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
-from extractor_base import normalize_text
+from extractor_base import lowered_text, normalize_text
 
 
 class FormType(str, Enum):
@@ -16,6 +17,9 @@ class FormType(str, Enum):
 
 @dataclass
 class DetectionResult:
+    # Explicit slots (dataclass(slots=True) needs 3.10): no per-instance __dict__.
+    __slots__ = ("form_type", "confidence", "matched_markers")
+
     form_type: FormType
     confidence: float
     matched_markers: List[str]
@@ -78,32 +82,90 @@ FORM_MARKERS: Dict[FormType, Dict[str, int]] = {
 }
 
 
-def _score_form(text: str, markers: Dict[str, int]) -> (int, List[str]):
+_ADMIN_FAST_SECONDARY = ("administration proceeding", "form a-1", "a1 (03/18)")
+
+
+def _is_admin(lowered: str, hint_lower: str) -> bool:
+    if "petition for letters of" not in lowered and "petition for letters of" not in hint_lower:
+        return False
+    return any(phrase in lowered or phrase in hint_lower for phrase in _ADMIN_FAST_SECONDARY)
+
+
+# Every distinct marker once, so shared markers are scanned for a single time per document.
+_ALL_MARKERS = tuple(dict.fromkeys(marker.lower() for markers in FORM_MARKERS.values() for marker in markers))
+
+
+def _find_markers(text: str) -> set:
+    # Plain str search on purpose: OCR text is usually UCS-2 (curly quotes, dashes), and encoding it
+    # to bytes first costs more than the ~30 substring checks it would speed up.
+    return {marker for marker in _ALL_MARKERS if marker in text}
+
+
+# FORM_MARKERS flattened once: (form_type, ((marker, marker_lower, weight), ...), max_score).
+_FORM_SCORING = tuple(
+    (
+        form_type,
+        tuple((marker, marker.lower(), weight) for marker, weight in markers.items()),
+        sum(abs(weight) for weight in markers.values()) or 1,
+    )
+    for form_type, markers in FORM_MARKERS.items()
+)
+
+
+# Most markers any form after position i could match; once a form scores 1.0 with at least that
+# many markers, no later form can beat it (confidence never exceeds 1.0).
+_LATER_MAX_MARKERS = tuple(
+    max((len(markers) for _, markers, _ in _FORM_SCORING[i + 1:]), default=0) for i in range(len(_FORM_SCORING))
+)
+
+
+def _score_form(found: set, markers: Tuple[Tuple[str, str, int], ...]) -> (int, List[str]):
     matched = []
     score = 0
-    for marker, weight in markers.items():
-        if marker.lower() in text:
+    for marker, marker_lower, weight in markers:
+        if marker_lower in found:
             matched.append(marker)
             score += weight
     return score, matched
 
 
-def detect_form(text: str, first_page_hint: str = "") -> DetectionResult:
-    normalized = normalize_text(text)
-    combined = f"{normalized}\n{first_page_hint}".lower()
-    if "petition for letters of" in combined and (
-        "administration proceeding" in combined or "form a-1" in combined or "a1 (03/18)" in combined
-    ):
+def _detect_form(text: str, first_page_hint: str) -> DetectionResult:
+    # Lowercasing commutes with normalize_text (it never adds or removes whitespace), and none of
+    # the fast-path phrases contain whitespace runs, so test them before paying for normalization.
+    lowered = lowered_text(text)
+    hint_lower = first_page_hint.lower()
+    if _is_admin(lowered, hint_lower):
         return DetectionResult(FormType.FORM_ADMIN, 1.0, ["petition for letters of", "administration proceeding"])
-    best: DetectionResult = DetectionResult(FormType.UNKNOWN, 0.0, [])
+    # normalize_text only matters to the markers where it collapses tabs or space runs; callers
+    # usually pass text that is already normalized, so skip the regex passes when there are none.
+    if "\t" in lowered or "  " in lowered:
+        lowered = normalize_text(lowered)
+        if _is_admin(lowered, hint_lower):
+            return DetectionResult(FormType.FORM_ADMIN, 1.0, ["petition for letters of", "administration proceeding"])
+    combined = f"{lowered}\n{hint_lower}"
+    best_type, best_confidence, best_matched = FormType.UNKNOWN, 0.0, []
 
-    for form_type, markers in FORM_MARKERS.items():
-        score, matched = _score_form(combined, markers)
-        max_score = sum(abs(weight) for weight in markers.values()) or 1
+    found = _find_markers(combined)
+    for idx, (form_type, markers, max_score) in enumerate(_FORM_SCORING):
+        score, matched = _score_form(found, markers)
         confidence = score / max_score
-        if confidence > best.confidence or (confidence == best.confidence and len(matched) > len(best.matched_markers)):
-            best = DetectionResult(form_type, confidence, matched)
+        if confidence > best_confidence or (confidence == best_confidence and len(matched) > len(best_matched)):
+            best_type, best_confidence, best_matched = form_type, confidence, matched
+        if best_confidence >= 1.0 and len(best_matched) >= _LATER_MAX_MARKERS[idx]:
+            break
 
-    if best.confidence <= 0:
+    if best_confidence <= 0:
         return DetectionResult(FormType.UNKNOWN, 0.0, [])
-    return best
+    return DetectionResult(best_type, best_confidence, best_matched)
+
+
+@lru_cache(maxsize=32)
+def _detect_form_cached(text: str, first_page_hint: str) -> Tuple[FormType, float, Tuple[str, ...]]:
+    result = _detect_form(text, first_page_hint)
+    return result.form_type, result.confidence, tuple(result.matched_markers)
+
+
+def detect_form(text: str, first_page_hint: str = "") -> DetectionResult:
+    # Detection is pure in its inputs; re-routing the same document reuses the scan.
+    form_type, confidence, matched = _detect_form_cached(text, first_page_hint)
+    return DetectionResult(form_type, confidence, list(matched))
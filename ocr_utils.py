@@ -1,13 +1,25 @@
-import io
+import hashlib
+import json
 import os
 import threading
-from typing import List, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Tuple
 
 import fitz
 from PIL import Image, ImageOps
 import pytesseract
 
 _last_info = {}
+_OCR_WORKERS = min(4, os.cpu_count() or 1)
+# Low-text pages without a page-sized scan are OCR'd at most at this DPI.
+_PARTIAL_PAGE_DPI = 200
+# Part of every OCR cache key. Bump it whenever the OCR pipeline changes what text a page yields
+# (preprocess_image, page DPI choice, blank-page detection, _ocr_pages/_extract_texts), so cached
+# text from the old pipeline is not served in its place.
+_OCR_CACHE_VERSION = 2
+_RENDERER = f"pymupdf {fitz.__doc__[:5] if hasattr(fitz,'__doc__') else ''}".strip()
 
 
 class ExtractionCancelled(Exception):
@@ -23,13 +35,112 @@ def preprocess_image(image: Image.Image) -> Image.Image:
     return ImageOps.autocontrast(gray)
 
 
-def _ocr_page(page, pdf_path: str, page_idx: int, dpi: int, cancel_event: Optional["threading.Event"] = None) -> str:
-    if cancel_event and cancel_event.is_set():
-        raise ExtractionCancelled("Cancelled before OCR page render.")
+def _ocr_cache_dir() -> Optional[str]:
+    # Disk cache of OCR text keyed by rendered pixels, plus whole-document results keyed by file
+    # content. It holds the text of every page processed, so it is opt-in (OCR_CACHE=1); DEBUG_EXTRACT
+    # bypasses it so the per-page artifacts are always written.
+    if os.getenv("OCR_CACHE") != "1" or os.getenv("DEBUG_EXTRACT") == "1":
+        return None
+    return os.getenv("OCR_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "probate_ocr")
+
+
+def _cache_get(key: str) -> Optional[str]:
+    cache_dir = _ocr_cache_dir()
+    if not cache_dir or not key:
+        return None
+    try:
+        with open(os.path.join(cache_dir, f"{key}.txt"), encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _cache_put(key: str, text: str) -> None:
+    cache_dir = _ocr_cache_dir()
+    if not cache_dir or not key:
+        return
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, f"{key}.txt")
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _is_blank_page(page) -> bool:
+    # Nothing drawn beyond a few characters of text: OCR would only re-read that text, so skip it.
+    return not page.get_images(full=False) and not page.get_drawings()
+
+
+def _tesseract_options() -> Tuple[str, str]:
+    # TESSERACT_LANG / TESSERACT_PSM / TESSERACT_OEM; unset keeps tesseract's defaults (eng, psm 3).
+    config = " ".join(
+        f"--{flag} {value}"
+        for flag, value in (("psm", os.getenv("TESSERACT_PSM")), ("oem", os.getenv("TESSERACT_OEM")))
+        if value
+    )
+    return os.getenv("TESSERACT_LANG") or "eng", config
+
+
+@lru_cache(maxsize=None)
+def _tesseract_identity(cmd: str) -> str:
+    # Binary and version: after upgrading or switching tesseract, text read by the old one is not reused.
+    try:
+        return f"{cmd}|{pytesseract.get_tesseract_version()}"
+    except Exception:  # noqa: BLE001
+        return f"{cmd}|unavailable"
+
+
+def _ocr_key_prefix() -> str:
+    # Shared by page and document keys so both track the same pipeline version, engine and settings:
+    # the same pixels read by another tesseract, or with another lang/psm, is another text.
+    lang, config = _tesseract_options()
+    identity = _tesseract_identity(pytesseract.pytesseract.tesseract_cmd)
+    return f"v{_OCR_CACHE_VERSION}|{identity}|{lang}|{config}"
+
+
+def _document_key(pdf_path: str, min_text_length: int, ocr_dpi: int, prefer_text_layer: bool) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        f"{_ocr_key_prefix()}|{fitz.VersionBind}|{min_text_length}|{ocr_dpi}|{_PARTIAL_PAGE_DPI}|{int(prefer_text_layer)}|".encode("utf-8")
+    )
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return f"doc-{digest.hexdigest()}"
+
+
+def _page_ocr_dpi(page, ocr_dpi: int) -> int:
+    # A scanned form is one image covering most of the page and needs the full DPI; stamps, logos
+    # or vector-only content read fine at a lower resolution (about half the pixels of 300 DPI).
+    page_area = abs(page.rect)
+    for info in page.get_image_info():
+        if page_area and abs(fitz.Rect(info["bbox"])) >= 0.5 * page_area:
+            return ocr_dpi
+    return min(ocr_dpi, _PARTIAL_PAGE_DPI)
+
+
+def _render_page(page, dpi: int) -> Tuple[Image.Image, str]:
+    # PyMuPDF objects are not thread-safe: rendering stays on the calling thread.
     matrix = fitz.Matrix(dpi / 72, dpi / 72)
     pix = page.get_pixmap(matrix=matrix)
-    img = Image.open(io.BytesIO(pix.tobytes("png")))
+    # Wrap the raw samples directly instead of a PNG encode/decode round-trip (same pixels).
+    img = Image.frombytes("RGBA" if pix.alpha else "RGB", (pix.width, pix.height), pix.samples)
+    if not _ocr_cache_dir():
+        return img, ""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{_ocr_key_prefix()}|{pix.width}x{pix.height}x{pix.n}".encode("utf-8"))
+    digest.update(pix.samples)
+    return img, digest.hexdigest()
+
+
+def _recognize_page(img: Image.Image, pdf_path: str, page_idx: int, cancel_event: Optional["threading.Event"] = None) -> str:
     processed = preprocess_image(img)
+    # Read once per page; still per call (not at import) so the flag can be toggled at runtime.
+    dbg_dir = None
     if os.getenv("DEBUG_EXTRACT") == "1":
         base = os.path.splitext(os.path.basename(pdf_path))[0]
         dbg_dir = os.path.join("debug_artifacts", base)
@@ -38,26 +149,71 @@ def _ocr_page(page, pdf_path: str, page_idx: int, dpi: int, cancel_event: Option
         processed.save(os.path.join(dbg_dir, f"page_{page_idx+1}_proc.png"))
     if cancel_event and cancel_event.is_set():
         raise ExtractionCancelled("Cancelled before OCR.")
-    text = pytesseract.image_to_string(processed)
-    if os.getenv("DEBUG_EXTRACT") == "1":
-        base = os.path.splitext(os.path.basename(pdf_path))[0]
-        dbg_dir = os.path.join("debug_artifacts", base)
+    lang, config = _tesseract_options()
+    text = pytesseract.image_to_string(processed, lang=lang, config=config)
+    if dbg_dir:
         with open(os.path.join(dbg_dir, f"page_{page_idx+1}_ocr.txt"), "w", encoding="utf-8") as f:
             f.write(text)
     return text
 
 
-def extract_pdf_text(
+def _recognize_and_cache(
+    img: Image.Image, key: str, pdf_path: str, page_idx: int, cancel_event: Optional["threading.Event"] = None
+) -> str:
+    text = _recognize_page(img, pdf_path, page_idx, cancel_event)
+    _cache_put(key, text)
+    return text
+
+
+def _ocr_page(page, pdf_path: str, page_idx: int, dpi: int, cancel_event: Optional["threading.Event"] = None) -> str:
+    if cancel_event and cancel_event.is_set():
+        raise ExtractionCancelled("Cancelled before OCR page render.")
+    img, key = _render_page(page, dpi)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    return _recognize_and_cache(img, key, pdf_path, page_idx, cancel_event)
+
+
+def _ocr_pages(doc, page_dpis: Dict[int, int], pdf_path: str, cancel_event: Optional["threading.Event"] = None) -> Dict[int, str]:
+    """
+    OCR several pages, each at its own DPI; tesseract runs as a subprocess, so recognition overlaps across threads
+    while pages are rendered one at a time here. At most ~2x workers rendered pages are held.
+    """
+    workers = min(_OCR_WORKERS, len(page_dpis))
+    if workers <= 1:
+        return {i: _ocr_page(doc[i], pdf_path, i, dpi, cancel_event) for i, dpi in page_dpis.items()}
+    # Each tesseract otherwise starts an OpenMP thread per core; with several running side by side
+    # that oversubscribes the CPU. The subprocesses inherit this (an explicit user value wins).
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    texts: Dict[int, str] = {}
+    in_flight: Deque[Tuple[int, "Future[str]"]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for i, dpi in page_dpis.items():
+            if cancel_event and cancel_event.is_set():
+                raise ExtractionCancelled("Cancelled before OCR page render.")
+            img, key = _render_page(doc[i], dpi)
+            cached = _cache_get(key)
+            if cached is not None:
+                texts[i] = cached
+                continue
+            in_flight.append((i, pool.submit(_recognize_and_cache, img, key, pdf_path, i, cancel_event)))
+            if len(in_flight) >= workers * 2:
+                idx, future = in_flight.popleft()
+                texts[idx] = future.result()
+        for idx, future in in_flight:
+            texts[idx] = future.result()
+    return texts
+
+
+def _extract_texts(
     pdf_path: str,
-    min_text_length: int = 80,
-    ocr_dpi: int = 300,
+    min_text_length: int,
+    ocr_dpi: int,
+    prefer_text_layer: bool,
     cancel_event: Optional["threading.Event"] = None,
-) -> Tuple[str, str, List[str]]:
-    global _last_info
-    env_min_text = os.getenv("MIN_TEXT_LEN")
-    if env_min_text and env_min_text.isdigit():
-        min_text_length = int(env_min_text)
-    prefer_text_layer = os.getenv("PREFER_TEXT_LAYER", "0") == "1"
+) -> Tuple[List[str], str, int, List[Optional[int]]]:
+    """Page texts, extraction method, text-layer length, and the DPI each page was OCR'd at (None: text layer)."""
     doc = fitz.open(pdf_path)
     try:
         page_texts = [doc[i].get_text("text") for i in range(len(doc))]
@@ -67,28 +223,58 @@ def extract_pdf_text(
         use_full_ocr = (total_len < min_text_length) and (not prefer_text_layer)
 
         if use_full_ocr:
-            texts = [_ocr_page(doc[i], pdf_path, i, ocr_dpi, cancel_event) for i in range(len(doc))]
+            ocr_dpis = dict.fromkeys(range(len(doc)), ocr_dpi)
+            ocr_texts = _ocr_pages(doc, ocr_dpis, pdf_path, cancel_event)
+            texts = [ocr_texts[i] for i in range(len(doc))]
             method = "OCR_FALLBACK"
         else:
-            texts = []
-            used_ocr = False
+            ocr_dpis: Dict[int, int] = {}
             for i in range(len(doc)):
                 if cancel_event and cancel_event.is_set():
                     raise ExtractionCancelled("Cancelled during text extraction.")
-                if len(_simple_normalize(page_texts[i])) < 10:
-                    texts.append(_ocr_page(doc[i], pdf_path, i, ocr_dpi, cancel_event))
-                    used_ocr = True
-                else:
-                    texts.append(page_texts[i])
-            method = "MIXED" if used_ocr else "TEXT_LAYER"
+                if len(_simple_normalize(page_texts[i])) < 10 and not _is_blank_page(doc[i]):
+                    ocr_dpis[i] = _page_ocr_dpi(doc[i], ocr_dpi)
+            ocr_texts = _ocr_pages(doc, ocr_dpis, pdf_path, cancel_event)
+            texts = [ocr_texts.get(i, page_texts[i]) for i in range(len(doc))]
+            method = "MIXED" if ocr_dpis else "TEXT_LAYER"
+        page_dpis = [ocr_dpis.get(i) for i in range(len(doc))]
     finally:
         doc.close()
+    return texts, method, total_len, page_dpis
+
+
+def extract_pdf_text(
+    pdf_path: str,
+    min_text_length: int = 80,
+    ocr_dpi: int = 300,
+    cancel_event: Optional["threading.Event"] = None,
+) -> Tuple[str, str, List[str]]:
+    global _last_info
+    env_min_text = os.getenv("MIN_TEXT_LEN")
+    if env_min_text and env_min_text.isdigit():
+        min_text_length = int(env_min_text)
+    prefer_text_layer = os.getenv("PREFER_TEXT_LAYER", "0") == "1"
+    # Re-runs over the same file (e.g. run_debug while tuning rules) skip opening and OCR entirely.
+    doc_key = _document_key(pdf_path, min_text_length, ocr_dpi, prefer_text_layer) if _ocr_cache_dir() else None
+    cached = _cache_get(doc_key) if doc_key else None
+    if cached is not None:
+        texts, method, total_len, page_dpis = json.loads(cached)
+    else:
+        texts, method, total_len, page_dpis = _extract_texts(
+            pdf_path, min_text_length, ocr_dpi, prefer_text_layer, cancel_event
+        )
+        if doc_key:
+            _cache_put(doc_key, json.dumps([texts, method, total_len, page_dpis]))
+    rendered_dpis = [dpi for dpi in page_dpis if dpi]
 
     _last_info = {
         "pdf": os.path.basename(pdf_path),
         "extraction_mode": method,
-        "render_dpi": ocr_dpi,
-        "renderer": f"pymupdf {fitz.__doc__[:5] if hasattr(fitz,'__doc__') else ''}".strip(),
+        # Lowest DPI any page was OCR'd at (pages without a scan use _PARTIAL_PAGE_DPI); None if
+        # every page came from the text layer. page_dpis has the per-page values.
+        "render_dpi": min(rendered_dpis) if rendered_dpis else None,
+        "page_dpis": page_dpis,
+        "renderer": _RENDERER,
         "pages": len(texts),
         "text_len": total_len,
     }
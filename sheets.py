@@ -3,6 +3,7 @@ from typing import List, Optional
 
 import gspread
 from google.oauth2 import service_account
+from gspread.utils import absolute_range_name
 
 REQUIRED_HEADERS = [
     "Deceased Property Address",
@@ -53,14 +54,21 @@ def _col_letter(n: int) -> str:
 def ensure_headers(ws, headers: List[str], log_fn=None) -> None:
     """Ensure required headers live in A1:I1 (fixed). Repairs or creates as needed, styles row, freezes row 1."""
     required_norm = {h.strip().lower() for h in headers}
+    # Both header ranges in one values.batchGet round-trip.
+    header_range = f"A1:{_col_letter(len(headers))}1"
     try:
-        row1 = ws.row_values(1)
+        payload = ws.spreadsheet.values_batch_get(
+            [absolute_range_name(ws.title, header_range), absolute_range_name(ws.title, "J1:Z1")]
+        )
+        value_ranges = payload.get("valueRanges", [])
+        existing_rows = value_ranges[0].get("values", []) if value_ranges else []
+        extra = value_ranges[1].get("values", []) if len(value_ranges) > 1 else []
     except Exception:
-        row1 = []
+        existing_rows, extra = [], []
+    row1 = existing_rows[0] if existing_rows else []
 
     # Check for stray headers in J1:Z1 and clear if they include any required names
     try:
-        extra = ws.get("J1:Z1")
         if extra and any(cell.strip().lower() in required_norm for cell in extra[0] if cell):
             ws.batch_clear(["J1:Z1"])
     except Exception:
@@ -117,13 +125,7 @@ def ensure_headers(ws, headers: List[str], log_fn=None) -> None:
         return
 
     # Check A1:I1 contents
-    try:
-        existing_range = ws.get(f"A1:{_col_letter(len(headers))}1")
-        existing = existing_range[0] if existing_range else []
-    except Exception:
-        existing = row1[: len(headers)]
-
-    existing = (existing + [""] * len(headers))[: len(headers)]
+    existing = (row1 + [""] * len(headers))[: len(headers)]
     if [e.strip().lower() for e in existing] != [h.lower() for h in headers]:
         _write_headers()
         if log_fn:
@@ -134,26 +136,19 @@ def ensure_headers(ws, headers: List[str], log_fn=None) -> None:
 
 
 def append_rows(ws, rows: List[List[str]], required_headers: List[str]):
-    def _next_empty_row() -> int:
-        try:
-            col_a = ws.col_values(1)
-        except Exception:
-            return 2
-        if not col_a:
-            return 2
-        for idx, val in enumerate(col_a[1:], start=2):
-            if not str(val).strip():
-                return idx
-        return len(col_a) + 1
-
     cleaned_rows: List[List[str]] = []
     for row in rows:
         out = list(row[: len(required_headers)])
         if len(out) < len(required_headers):
             out += [""] * (len(required_headers) - len(out))
         cleaned_rows.append(out)
-
-    for out in cleaned_rows:
-        next_row = _next_empty_row()
-        range_name = f"A{next_row}:I{next_row}"
-        ws.update(range_name, [out], value_input_option="USER_ENTERED")
+    if not cleaned_rows:
+        return
+    # One values.append request for the whole batch; the API places rows after the A1 table, so no
+    # next-row probe is read and concurrent appends cannot overwrite each other (a local row cursor could).
+    ws.append_rows(
+        cleaned_rows,
+        value_input_option="USER_ENTERED",
+        insert_data_option="INSERT_ROWS",
+        table_range="A1",
+    )
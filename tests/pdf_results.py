@@ -0,0 +1,76 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from main import process_pdf
+
+PDF_DIR = os.path.join(os.path.dirname(__file__), "..", "pdf")
+MIN_TEXT_LENGTH = 200
+OCR_DPI = 300
+
+# OCR results are reused across sessions from a tests-local cache (gitignored) unless OCR_CACHE_DIR
+# is set explicitly; run with OCR_CACHE=0 to OCR everything from scratch. Set before any process_pdf
+# call so the prefetch workers inherit it.
+os.environ.setdefault("OCR_CACHE", "1")
+os.environ.setdefault("OCR_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+
+# Every PDF the tests assert on; the first lookup parses all of the present ones in parallel.
+# No born-digital shortcut is needed here: extract_pdf_text already uses the text layer and only
+# OCRs pages without one (the committed fixtures are image-only scans).
+FIXTURE_PDFS = (
+    "2025-1166___PROBATE PETITION.pdf",
+    "2025-1461_PROBATE PETITION.pdf",
+    "2025-1463_PROBATE PETITION.pdf",
+    "2026-10_PROBATE PETITION.pdf",
+    "2026-16_PROBATE PETITION.pdf",
+    "2026-19_PROBATE PETITION.pdf",
+    "2026-8_ADMINISTRATION PETITION.pdf",
+)
+
+_prefetched: Dict[str, List[dict]] = {}
+_prefetch_started = False
+
+
+def pdf_path(pdf_name: str) -> str:
+    return os.path.join(PDF_DIR, pdf_name)
+
+
+def _init_worker() -> None:
+    # One tesseract thread per process; the pool already uses every core.
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def _parse(pdf_name: str) -> Tuple[str, Optional[List[dict]]]:
+    try:
+        return pdf_name, process_pdf(pdf_path(pdf_name), min_text_length=MIN_TEXT_LENGTH, ocr_dpi=OCR_DPI)
+    except Exception:  # noqa: BLE001
+        # Left to the on-demand parse, which raises the real error inside the test that needs it.
+        return pdf_name, None
+
+
+def _prefetch() -> None:
+    global _prefetch_started
+    if _prefetch_started:
+        return
+    _prefetch_started = True
+    names = [name for name in FIXTURE_PDFS if os.path.exists(pdf_path(name))]
+    if len(names) < 2:
+        return
+    with ProcessPoolExecutor(max_workers=min(len(names), os.cpu_count() or 1), initializer=_init_worker) as pool:
+        for name, results in pool.map(_parse, names):
+            if results is not None:
+                _prefetched[name] = results
+
+
+@lru_cache(maxsize=None)
+def process_fixture(pdf_name: str, min_text_length: int = MIN_TEXT_LENGTH, ocr_dpi: int = OCR_DPI):
+    # Several test modules assert on the same PDF; parse each one once per session.
+    # Callers share the returned results, so treat them as read-only. Only the OCR text is cached
+    # across sessions (see OCR_CACHE_DIR above); parsed rows are not, so extractor changes are
+    # always exercised.
+    if (min_text_length, ocr_dpi) == (MIN_TEXT_LENGTH, OCR_DPI):
+        _prefetch()
+        if pdf_name in _prefetched:
+            return _prefetched.pop(pdf_name)
+    return process_pdf(pdf_path(pdf_name), min_text_length=min_text_length, ocr_dpi=ocr_dpi)
@@ -2,14 +2,25 @@ import unittest
 
 from extractor_base import clean_address_strict
 from extractor_form_a import _extract_relationship, extract_form_a
+from extractor_form_admin import _extract_petitioner_address
 from extractor_base import normalize_text
 
 
+# (raw, expected) petitioner addresses for clean_address_strict; add new inputs here rather than
+# as separate tests. The Ventura Drive case is the Raymond Coles beneficiary-text regression.
+STRICT_ADDRESS_CASES = (
+    (
+        "1311 Ventura Drive, beneficiary of residuary estate Ole . Y Lakewood, New Jersey 08701",
+        "1311 Ventura Drive, Lakewood, NJ 08701",
+    ),
+)
+
+
 class AddressRelationshipTests(unittest.TestCase):
     def test_beneficiary_address_stripped(self):
-        raw = "1311 Ventura Drive, beneficiary of residuary estate Ole . Y Lakewood, New Jersey 08701"
-        cleaned = clean_address_strict(raw, field="Petitioner Address")
-        self.assertEqual(cleaned, "1311 Ventura Drive, Lakewood, NJ 08701")
+        for raw, expected in dict.fromkeys(STRICT_ADDRESS_CASES):
+            with self.subTest(raw=raw):
+                self.assertEqual(clean_address_strict(raw, field="Petitioner Address"), expected)
 
     def test_relationship_table_ignored(self):
         # Table page with child but no petitioner relationship
@@ -42,10 +53,10 @@ State New York Zip Code 10301
         self.assertEqual(fields["Petitioner Address"], "16 Ada Drive, Staten Island, NY 10314")
         self.assertEqual(fields["Relationship"], "Spouse")
 
-    def test_raymond_coles_address_clean(self):
-        raw = "1311 Ventura Drive, beneficiary of residuary estate Ole . Y Lakewood, New Jersey 08701"
-        cleaned = clean_address_strict(raw, field="Petitioner Address")
-        self.assertEqual(cleaned, "1311 Ventura Drive, Lakewood, NJ 08701")
+    def test_admin_domicile_line_with_spaced_colon(self):
+        # "Domicile :" misses the "domicile:" block pattern and is read by the section-1 line scan.
+        page1 = "1. Petitioner\nDomicile : 12 Main Street, Springfield\nSpringfield, NY 10001\n"
+        self.assertEqual(_extract_petitioner_address([page1], debug={}), "12 Main Street, Springfield, NY 10001")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+import glob
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+from main import _iter_pdf_paths
+
+
+class BatchPathTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        for rel in ("a.pdf", "SCAN.PDF", "Petition.Pdf", ".hidden.pdf", "notes.txt", os.path.join("sub", "C.PDF")):
+            path = os.path.join(self.root, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "wb").close()
+
+    def test_matches_glob(self):
+        for recursive, pattern in ((False, "*.pdf"), (True, "**/*.pdf")):
+            with self.subTest(recursive=recursive):
+                expected = sorted(glob.glob(os.path.join(self.root, pattern), recursive=recursive))
+                self.assertEqual(sorted(_iter_pdf_paths(self.root, recursive)), expected)
+
+    def test_uppercase_extension_on_case_insensitive_platform(self):
+        # Windows (where the frozen exe ships) folds case; emulate its normcase here.
+        with mock.patch.object(main.os.path, "normcase", side_effect=str.lower):
+            found = sorted(os.path.basename(p) for p in _iter_pdf_paths(self.root, True))
+        self.assertEqual(found, ["C.PDF", "Petition.Pdf", "SCAN.PDF", "a.pdf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import csv
+import glob
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+
+DEBUG_DIR = os.path.join(os.path.dirname(__file__), "..", "debug")
+
+
+def _fake_extract_pdf_text(pdf_path, min_text_length=200, ocr_dpi=300, cancel_event=None):
+    # Page text from the committed debug dumps; "<name> copy.pdf" reuses <name>'s pages.
+    name = os.path.splitext(os.path.basename(pdf_path))[0].replace(" copy", "")
+    files = sorted(
+        glob.glob(os.path.join(DEBUG_DIR, name, "page_*.txt")),
+        key=lambda p: int(p.rsplit("_", 1)[1][:-4]),
+    )
+    pages = []
+    for path in files:
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    return "\n".join(pages), "TEXT_LAYER", pages
+
+
+@unittest.skipUnless(
+    multiprocessing.get_start_method() == "fork", "the stubbed extractor only reaches forked workers"
+)
+class BatchWorkersTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.pdf_dir = os.path.join(self.root, "pdf")
+        os.makedirs(self.pdf_dir)
+        names = sorted(os.listdir(DEBUG_DIR))
+        names = [n for n in names if os.path.isdir(os.path.join(DEBUG_DIR, n))][:4]
+        # The copy repeats its original's names, so the BLEED guard has something to trip on.
+        for name in names + [f"{names[0]} copy"]:
+            open(os.path.join(self.pdf_dir, f"{name}.pdf"), "wb").close()
+
+    def _run(self, workers):
+        warnings = []
+        finalize = main._finalize_case
+
+        def record(case, prev_seen):
+            result = finalize(case, prev_seen)
+            warnings.append(list(result["warnings"]))
+            return result
+
+        out_csv = os.path.join(self.root, f"out_{workers}.csv")
+        settings = {"workers": workers, "log_path": os.path.join(self.root, f"log_{workers}.json")}
+        with mock.patch.object(main, "extract_pdf_text", _fake_extract_pdf_text), mock.patch.object(
+            main, "_finalize_case", side_effect=record
+        ):
+            main.run_batch(self.pdf_dir, out_csv, settings=settings)
+        with open(out_csv, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.reader(f))
+        return rows, warnings
+
+    def test_workers_match_in_process_run(self):
+        serial_rows, serial_warnings = self._run(1)
+        parallel_rows, parallel_warnings = self._run(2)
+        self.assertGreater(len(serial_rows), 1)
+        self.assertTrue(any(w.startswith("BLEED_GUARD_TRIP") for ws in serial_warnings for w in ws))
+        self.assertEqual(parallel_rows, serial_rows)
+        self.assertEqual(parallel_warnings, serial_warnings)
+
+
+if __name__ == "__main__":
+    unittest.main()
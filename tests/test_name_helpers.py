@@ -0,0 +1,26 @@
+import unittest
+
+from extractor_form_a import _clean_name, _strict_decedent_name_scan
+
+
+class NameHelperTests(unittest.TestCase):
+    def test_decedent_scan_pattern_priority(self):
+        # "Estate of" outranks the decedent-information block even when it appears later.
+        text = "DECEDENT INFORMATION\nName: Mary Jones\n\nIn the matter of the Estate of John Smith, deceased\n"
+        self.assertEqual(_strict_decedent_name_scan(text), "John Smith")
+
+    def test_decedent_scan_proceeding_gap_stays_on_one_line(self):
+        # The gap between the proceeding caption and "Will of" may hold any same-line text
+        # (including "n" and "\\"), but not a line break.
+        same_line = "PROBATE PROCEEDING in Kings County, Will of John Smith\n"
+        self.assertEqual(_strict_decedent_name_scan(same_line), "John Smith")
+        self.assertEqual(_strict_decedent_name_scan("PROBATE PROCEEDING\nWILL OF John Smith\n"), "")
+
+    def test_clean_name_strips_token_punctuation_only_at_the_ends(self):
+        # "J.R." is a middle initial (kept, with its dots normalized away), not a "jr" suffix to drop.
+        self.assertEqual(_clean_name("Robert J.R. Tolkien"), "Robert Jr Tolkien")
+        self.assertEqual(_clean_name("John Smith Jr."), "John Smith")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,18 @@
 import os
 import unittest
 
-from main import process_pdf
 from extractor import Columns
+from pdf_results import pdf_path, process_fixture
 
 
-PDF_PATH = os.path.join("pdf", "2025-1166___PROBATE PETITION.pdf")
+PDF_NAME = "2025-1166___PROBATE PETITION.pdf"
+PDF_PATH = pdf_path(PDF_NAME)
 
 
 @unittest.skipUnless(os.path.exists(PDF_PATH), "Fixture PDF missing")
 class ProbateBobbeTest(unittest.TestCase):
     def test_bobbe_butler_fields(self):
-        results = process_pdf(PDF_PATH, min_text_length=200, ocr_dpi=300)
+        results = process_fixture(PDF_NAME)
         self.assertGreaterEqual(len(results), 1)
         row = results[0]["row"]
         row_map = {Columns[i]: row[i] for i in range(len(Columns))}
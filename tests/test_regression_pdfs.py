@@ -1,17 +1,13 @@
 import os
 import unittest
 
-from main import process_pdf
-
-PDF_DIR = os.path.join(os.path.dirname(__file__), "..", "pdf")
+from pdf_results import pdf_path, process_fixture
 
 
 def _first_row(pdf_name: str):
-    path = os.path.join(PDF_DIR, pdf_name)
-    if not os.path.exists(path):
+    if not os.path.exists(pdf_path(pdf_name)):
         raise unittest.SkipTest(f"{pdf_name} not present")
-    result = process_pdf(path, min_text_length=200, ocr_dpi=300)
-    return result[0]["row"]
+    return process_fixture(pdf_name)[0]["row"]
 
 
 class RegressionExtractionTests(unittest.TestCase):
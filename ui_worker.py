@@ -1,9 +1,19 @@
 import queue
 import threading
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional
 
 from main import run_batch
 
+# Log lines are sent to the UI in batches: at this many lines, at most this long after they were
+# logged (a flusher thread drains the buffer even while run_batch is busy), or before any other
+# message so the UI still sees everything in order.
+_LOG_BATCH_LINES = 64
+_LOG_BATCH_SECONDS = 0.05
+# At most ~20 progress updates per second reach the UI; the latest stats always win, and the
+# flusher thread delivers held stats even when no further update follows.
+_PROGRESS_MIN_SECONDS = 0.05
+
 
 class WorkerThread(threading.Thread):
     """Background worker that runs the batch extraction and streams updates."""
@@ -15,26 +25,62 @@ class WorkerThread(threading.Thread):
         sheet_cfg: Optional[Dict],
         settings: Optional[Dict],
         message_queue: "queue.Queue",
+        max_workers: Optional[int] = None,
     ):
         super().__init__(daemon=True)
         self.pdf_dir = pdf_dir
         self.out_csv = out_csv
         self.sheet_cfg = sheet_cfg or {}
-        self.settings = settings or {}
+        self.settings = dict(settings or {})
+        if max_workers:
+            # PDFs are extracted in this many worker processes (run_batch's "workers" setting).
+            self.settings["workers"] = max_workers
         self.message_queue = message_queue
         self.cancel_event = threading.Event()
         self.result = None
+        # Filled by run_batch's callbacks on this thread, drained by the flusher thread too.
+        self._buf_lock = threading.Lock()
+        self._stop_flusher = threading.Event()
+        self._log_buf: List[str] = []
+        self._pending_stats: Optional[Dict] = None
+        self._last_progress = 0.0
 
     def cancel(self):
         self.cancel_event.set()
 
+    def _flush(self):
+        # Logs first, then the latest stats, so the UI sees lines before the count they led to.
+        with self._buf_lock:
+            if self._log_buf:
+                self.message_queue.put({"type": "log_batch", "messages": self._log_buf})
+                self._log_buf = []
+            if self._pending_stats is not None:
+                self.message_queue.put({"type": "progress", "stats": self._pending_stats})
+                self._pending_stats = None
+                self._last_progress = time.monotonic()
+
+    def _flush_loop(self):
+        while not self._stop_flusher.wait(_LOG_BATCH_SECONDS):
+            self._flush()
+
     def _on_log(self, msg: str):
-        self.message_queue.put({"type": "log", "message": msg})
+        with self._buf_lock:
+            self._log_buf.append(msg)
+            full = len(self._log_buf) >= _LOG_BATCH_LINES
+        if full:
+            self._flush()
 
     def _on_progress(self, stats: Dict):
-        self.message_queue.put({"type": "progress", "stats": stats})
+        # run_batch reuses one stats dict; send a snapshot since the UI reads it later.
+        with self._buf_lock:
+            self._pending_stats = dict(stats)
+            due = time.monotonic() - self._last_progress >= _PROGRESS_MIN_SECONDS
+        if due:
+            self._flush()
 
     def run(self):
+        flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        flusher.start()
         try:
             summary = run_batch(
                 pdf_dir=self.pdf_dir,
@@ -46,6 +92,12 @@ class WorkerThread(threading.Thread):
                 cancel_event=self.cancel_event,
             )
             self.result = summary
+            self._flush()
             self.message_queue.put({"type": "done", "result": summary})
         except Exception as exc:  # noqa: BLE001
+            self._flush()
             self.message_queue.put({"type": "error", "error": str(exc)})
+        finally:
+            self._stop_flusher.set()
+            flusher.join()
+            self._flush()